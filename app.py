@@ -1,14 +1,24 @@
 import streamlit as st
 import os
+import hashlib
 import tempfile
+import atexit
+import shutil
+import time
 import zipfile
 import io
+from typing import Tuple
 from dotenv import load_dotenv
 from utils.transcription import GladiaAPI
+from utils.batch_transcriber import BatchTranscriber
+from utils.callback_receiver import CallbackReceiver, is_local_url
 from utils.text_formatter import GeminiFormatter
-from utils.voicevox import VoiceVoxAPI
+from utils.voicevox import VoiceVoxAPI, SpeakerCatalog
+from utils.voicevox_pool import VoiceVoxEnginePool
+from utils.disk_cache import DiskCache
 from utils.video_generator import VideoGenerator
 from utils.text_segmenter import TextSegmenter
+from utils.speculative_synthesizer import SpeculativeSynthesizer
 
 # 環境変数を読み込み
 load_dotenv()
@@ -474,6 +484,42 @@ if 'generated_video' not in st.session_state:
 if 'combined_video' not in st.session_state:
     st.session_state.combined_video = None
 
+
+@st.cache_resource
+def cleanup_stale_work_dirs(max_age_hours: float) -> int:
+    """
+    以前のプロセスが残した古い作業ディレクトリを削除（プロセスの起動時に1回だけ実行）
+
+    Returns:
+        削除したディレクトリの数
+    """
+    removed = 0
+    cutoff = time.time() - max_age_hours * 3600
+    temp_root = tempfile.gettempdir()
+    for name in os.listdir(temp_root):
+        path = os.path.join(temp_root, name)
+        if not name.startswith("tiktok_re_editor_") or not os.path.isdir(path):
+            continue
+        try:
+            if os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        except OSError:
+            continue
+    if removed:
+        print(f"古い作業ディレクトリを{removed}件削除しました")
+    return removed
+
+
+# この時間より前に更新が止まった作業ディレクトリは、終了処理をせずに落ちたセッションの残りとみなして削除する
+cleanup_stale_work_dirs(float(os.getenv("WORK_DIR_MAX_AGE_HOURS", "24")))
+
+if 'work_dir' not in st.session_state:
+    # セッションごとの作業ディレクトリ（クリップ音声などの中間ファイルを置く）
+    st.session_state.work_dir = tempfile.mkdtemp(prefix="tiktok_re_editor_")
+    # プロセスの終了時に削除する（セッション終了は検知できないため、残ったものは次回起動時に削除）
+    atexit.register(shutil.rmtree, st.session_state.work_dir, ignore_errors=True)
+
 # タイトル
 st.title("🎬 TikTok Re-Editor Video")
 st.markdown("動画をアップロードして、文字起こし → 整形 → 音声合成 → 動画生成を自動実行")
@@ -528,10 +574,16 @@ with st.sidebar:
         help="テキスト整形・ファイル名生成用APIキー（動画アップロード時のみ必要）"
     )
 
+    gemini_regenerate = st.checkbox(
+        "🔄 Geminiの結果を再利用せずに生成し直す",
+        value=False,
+        help="オフの場合、同じテキストの整形・ファイル名・SNS用テキストは保存済みの結果をすぐに返します"
+    )
+
     voicevox_url = st.text_input(
         "🎙️ VOICEVOX URL",
         value=env_voicevox,
-        help="通常は変更不要。あなたのPCでVOICEVOXを起動してください。"
+        help="通常は変更不要。あなたのPCでVOICEVOXを起動してください。複数のエンジンを使う場合はカンマ区切りで指定します。"
     )
 
     st.markdown("---")
@@ -543,10 +595,151 @@ with st.sidebar:
     st.markdown("---")
     st.markdown('<p style="color: #000000 !important;">💡 テキストファイルから生成する場合、Gladia/Gemini APIは不要です</p>', unsafe_allow_html=True)
 
+@st.cache_resource
+def get_voicevox_client(base_url: str) -> VoiceVoxAPI:
+    """VOICEVOXクライアントを再実行・セッションをまたいで共有（接続プールを使い回す）"""
+    # 合成済み音声はディスクにキャッシュし、同じテキストは再合成しない
+    cache = DiskCache(
+        os.getenv("VOICEVOX_CACHE_DIR", "~/.cache/tiktok-re-editor/voicevox"),
+        max_bytes=int(os.getenv("VOICEVOX_CACHE_MAX_MB", "500")) * 1024 * 1024,
+        suffix=".wav"
+    )
+    # 試聴用サンプルは別ディレクトリに保存（音声キャッシュのLRUで消えないように）
+    sample_cache = DiskCache(
+        os.getenv("VOICEVOX_SAMPLE_CACHE_DIR", "~/.cache/tiktok-re-editor/voicevox_samples"),
+        max_bytes=200 * 1024 * 1024,
+        suffix=".wav"
+    )
+
+    # カンマ区切りで複数のURLが指定された場合はエンジンプールで負荷分散する
+    urls = [url.strip() for url in base_url.split(",") if url.strip()]
+    if len(urls) > 1:
+        return VoiceVoxEnginePool(urls, cache=cache, sample_cache=sample_cache)
+    return VoiceVoxAPI(base_url, cache=cache, sample_cache=sample_cache)
+
+
+@st.cache_resource
+def get_speaker_catalog(base_url: str) -> SpeakerCatalog:
+    """スピーカー一覧をセッション間で共有（TTL内は再実行ごとにエンジンへ問い合わせない）"""
+    return SpeakerCatalog(get_voicevox_client(base_url), ttl=300.0)
+
+
+@st.cache_resource
+def get_gladia_callback_receiver(port: int, public_url: str) -> CallbackReceiver:
+    """Gladiaの完了コールバック受信サーバーを1つだけ起動して共有"""
+    receiver = CallbackReceiver(port=port, public_url=public_url or None)
+    receiver.start()
+    return receiver
+
+
+@st.cache_resource
+def get_transcript_cache() -> DiskCache:
+    """文字起こし結果のキャッシュ（同じ動画は再アップロード・再文字起こししない）"""
+    return DiskCache(
+        os.getenv("GLADIA_CACHE_DIR", "~/.cache/tiktok-re-editor/gladia"),
+        max_bytes=int(os.getenv("GLADIA_CACHE_MAX_MB", "100")) * 1024 * 1024,
+        suffix=".json"
+    )
+
+
+def stage_uploaded_file(uploaded_file, subdir: str = "media", exclusive: bool = False, chunk_size: int = 1024 * 1024) -> Tuple[str, str]:
+    """
+    アップロードされたファイルをセッションの作業ディレクトリへ一定サイズずつコピー
+
+    コピーは1回のアップロードにつき1回だけで、再実行時は同じパスを返す。
+    ファイル名はコピーしながら計算した内容のSHA-256にする
+
+    Args:
+        uploaded_file: st.file_uploaderが返すファイル
+        subdir: 作業ディレクトリ内の保存先
+        exclusive: Trueの場合、同じsubdirに以前保存したファイルを削除する（1件だけ扱う画面用）
+        chunk_size: 1回にコピーするバイト数
+
+    Returns:
+        (保存先のパス, 内容のSHA-256)
+    """
+    staged = st.session_state.setdefault("staged_uploads", {})
+    upload_id = (subdir, getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}:{uploaded_file.size}")
+    entry = staged.get(upload_id)
+    if entry and os.path.exists(entry[0]):
+        return entry
+
+    if exclusive:
+        for other_id in [key for key in staged if key[0] == subdir and key != upload_id]:
+            other_path = staged.pop(other_id)[0]
+            if os.path.exists(other_path) and all(path != other_path for path, _ in staged.values()):
+                os.unlink(other_path)
+
+    directory = os.path.join(st.session_state.work_dir, subdir)
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, part_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    uploaded_file.seek(0)
+    with os.fdopen(fd, "wb") as f:
+        for chunk in iter(lambda: uploaded_file.read(chunk_size), b""):
+            digest.update(chunk)
+            f.write(chunk)
+
+    content_hash = digest.hexdigest()
+    suffix = os.path.splitext(uploaded_file.name)[1].lower() or ".bin"
+    path = os.path.join(directory, content_hash + suffix)
+    os.replace(part_path, path)
+    staged[upload_id] = (path, content_hash)
+    return path, content_hash
+
+
+def discard_staged_file(path: str):
+    """stage_uploaded_fileで保存したファイルを削除（文字起こし結果は内容のハッシュでキャッシュ済みなので不要）"""
+    staged = st.session_state.get("staged_uploads", {})
+    for upload_id in [key for key, (staged_path, _) in staged.items() if staged_path == path]:
+        del staged[upload_id]
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def cancel_speculative_synthesis():
+    """前景の合成を始める前に先読み合成を止める（エンジンの処理枠を取り合わないように）"""
+    speculative_synth = st.session_state.get("speculative_synth")
+    if speculative_synth is not None:
+        speculative_synth.cancel()
+
+
+@st.cache_resource
+def get_gemini_cache() -> DiskCache:
+    """Geminiのレスポンスキャッシュ（同じテキストの整形・生成はAPIを呼ばない）"""
+    return DiskCache(
+        os.getenv("GEMINI_CACHE_DIR", "~/.cache/tiktok-re-editor/gemini"),
+        max_bytes=int(os.getenv("GEMINI_CACHE_MAX_MB", "50")) * 1024 * 1024,
+        suffix=".txt",
+        ttl=float(os.getenv("GEMINI_CACHE_TTL_HOURS", "168")) * 3600
+    )
+
+
+# この文字数を超えるテキストは文単位に分割して並列合成する
+LONG_TEXT_THRESHOLD = 200
+
+# 長い動画はおよそこの秒数ごとに無音の箇所で分割し、並列に文字起こしする
+TRANSCRIBE_SPLIT_SECONDS = 300.0
+
 # APIクライアントの初期化
-gladia = GladiaAPI(gladia_api_key) if gladia_api_key else None
-gemini = GeminiFormatter(gemini_api_key) if gemini_api_key else None
-voicevox = VoiceVoxAPI(voicevox_url)
+# GLADIA_CALLBACK_PORTを設定するとポーリングの代わりに完了コールバックを待つ
+# （GladiaからはGLADIA_CALLBACK_URLの公開URLにしか届かないため、未設定ならローカルのAPIの場合のみ）
+gladia_api_url = os.getenv("GLADIA_API_URL", "https://api.gladia.io/v2")
+gladia_callback_port = os.getenv("GLADIA_CALLBACK_PORT", "")
+gladia_callback_url = os.getenv("GLADIA_CALLBACK_URL", "")
+gladia_receiver = (
+    get_gladia_callback_receiver(int(gladia_callback_port), gladia_callback_url)
+    if gladia_callback_port and (gladia_callback_url or is_local_url(gladia_api_url)) else None
+)
+gladia = GladiaAPI(
+    gladia_api_key,
+    base_url=gladia_api_url,
+    callback_receiver=gladia_receiver,
+    cache=get_transcript_cache()
+) if gladia_api_key else None
+gemini = GeminiFormatter(gemini_api_key, cache=get_gemini_cache()) if gemini_api_key else None
+voicevox = get_voicevox_client(voicevox_url)
+speaker_catalog = get_speaker_catalog(voicevox_url)
 video_gen = VideoGenerator()
 text_segmenter = TextSegmenter(min_chars=10, max_chars=150)
 
@@ -554,7 +747,7 @@ text_segmenter = TextSegmenter(min_chars=10, max_chars=150)
 st.header("📥 1. 入力ソース選択")
 
 # タブで動画とテキストを切り替え
-tab1, tab2 = st.tabs(["📹 動画から生成", "📄 テキストから生成"])
+tab1, tab2, tab3 = st.tabs(["📹 動画から生成", "📄 テキストから生成", "📚 一括文字起こし"])
 
 with tab1:
     st.subheader("動画アップロード")
@@ -566,13 +759,15 @@ with tab1:
     )
 
     if uploaded_file is not None:
-        # 動画を一時ファイルとして保存
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp_file:
-            tmp_file.write(uploaded_file.read())
-            tmp_file_path = tmp_file.name
-
         st.info(f"📁 アップロードされたファイル: {uploaded_file.name}")
 
+        remove_silence = st.checkbox(
+            "🔇 長い無音をカットしてから文字起こし",
+            value=True,
+            help="1秒以上の無音を取り除いてアップロードするので、アップロードと文字起こしが速くなります（タイムスタンプは元の動画の時刻に戻します）",
+            key="remove_silence"
+        )
+
         # 文字起こしボタン
         if st.button("START...", key="transcribe_btn"):
             # APIキーチェック
@@ -581,56 +776,66 @@ with tab1:
                 st.stop()
 
             with st.status("処理中...", expanded=True) as status:
-                st.write("📤 動画をアップロード中...")
-                audio_url = gladia.upload_file(tmp_file_path)
-
-                if audio_url:
-                    st.write("✅ アップロード完了")
-                    st.write("🎤 文字起こし中... (数分かかる場合があります)")
-
-                    transcribed = gladia.transcribe(audio_url, language="ja")
-
-                    if transcribed:
-                        st.session_state.transcribed_text = transcribed
-                        st.write("✅ 文字起こし完了")
-
-                        st.write("✏️ テキスト整形中...")
-                        formatted = gemini.format_text(transcribed)
-
-                        if formatted:
-                            st.session_state.formatted_text = formatted
-                            st.write("✅ テキスト整形完了")
-
-                            st.write("📝 ファイル名生成中...")
-                            filename = gemini.generate_filename(formatted)
-
-                            if filename:
-                                st.session_state.filename = filename
-                                st.write("✅ ファイル名生成完了")
-                                status.update(label="✅ すべての処理が完了しました！", state="complete")
-                                # 整形済みテキストセクションに自動スクロール
-                                st.components.v1.html("""
-                                <script>
-                                    setTimeout(function() {
-                                        const section = window.parent.document.getElementById('formatted-text-section');
-                                        if (section) {
-                                            section.scrollIntoView({behavior: 'smooth', block: 'start'});
-                                        }
-                                    }, 500);
-                                </script>
-                                """, height=0)
-                            else:
-                                st.error("ファイル名生成に失敗しました")
+                st.write("📤 アップロード → 🎤 文字起こし中... (数分かかる場合があります。同じ動画は保存済みの結果を使います)")
+                upload_progress = st.progress(0.0)
+
+                def show_upload_progress(sent: int, total: int):
+                    upload_progress.progress(
+                        min(sent / total, 1.0) if total else 1.0,
+                        text=f"アップロード中: {sent / 1024 / 1024:.1f} / {total / 1024 / 1024:.1f} MB"
+                    )
+
+                # 動画を作業ディレクトリへ保存し、文字起こしが終わったら削除する
+                # （結果は内容のハッシュでキャッシュされるので、同じ動画なら次回はアップロードしない）
+                media_path, media_hash = stage_uploaded_file(uploaded_file, exclusive=True)
+                try:
+                    transcribed = gladia.transcribe_from_file(
+                        media_path,
+                        language="ja",
+                        progress_callback=show_upload_progress,
+                        split_seconds=TRANSCRIBE_SPLIT_SECONDS,
+                        remove_silence=remove_silence,
+                        content_hash=media_hash
+                    )
+                finally:
+                    discard_staged_file(media_path)
+                upload_progress.empty()
+
+                if transcribed:
+                    st.session_state.transcribed_text = transcribed
+                    st.write("✅ 文字起こし完了")
+
+                    st.write("✏️ テキスト整形中...")
+                    formatted = gemini.format_text(transcribed, use_cache=not gemini_regenerate)
+
+                    if formatted:
+                        st.session_state.formatted_text = formatted
+                        st.write("✅ テキスト整形完了")
+
+                        st.write("📝 ファイル名生成中...")
+                        filename = gemini.generate_filename(formatted, use_cache=not gemini_regenerate)
+
+                        if filename:
+                            st.session_state.filename = filename
+                            st.write("✅ ファイル名生成完了")
+                            status.update(label="✅ すべての処理が完了しました！", state="complete")
+                            # 整形済みテキストセクションに自動スクロール
+                            st.components.v1.html("""
+                            <script>
+                                setTimeout(function() {
+                                    const section = window.parent.document.getElementById('formatted-text-section');
+                                    if (section) {
+                                        section.scrollIntoView({behavior: 'smooth', block: 'start'});
+                                    }
+                                }, 500);
+                            </script>
+                            """, height=0)
                         else:
-                            st.error("テキスト整形に失敗しました")
+                            st.error("ファイル名生成に失敗しました")
                     else:
-                        st.error("文字起こしに失敗しました")
+                        st.error("テキスト整形に失敗しました")
                 else:
-                    st.error("動画のアップロードに失敗しました")
-
-        # 一時ファイルを削除
-        if os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
+                    st.error("文字起こしに失敗しました")
 
 with tab2:
     st.subheader("テキストファイルアップロード")
@@ -683,6 +888,85 @@ with tab2:
                 except Exception as e:
                     st.error(f"❌ テキスト読み込みエラー: {str(e)}")
 
+with tab3:
+    st.subheader("複数動画の一括文字起こし")
+
+    batch_files = st.file_uploader(
+        "動画ファイルを選択してください（複数可）",
+        type=["mp4", "mov", "avi", "mkv", "webm"],
+        accept_multiple_files=True,
+        key="batch_video_uploader"
+    )
+
+    if batch_files:
+        st.info(f"📁 {len(batch_files)}件のファイルを選択中")
+
+        if st.button("START...", key="batch_transcribe_btn"):
+            if not gladia_api_key:
+                st.error("⚠️ サイドバーでGladia APIキーを入力してください")
+                st.stop()
+
+            # アップロードされた動画を作業ディレクトリに保存
+            batch_dir = tempfile.mkdtemp(prefix="batch_", dir=st.session_state.work_dir)
+            # ハッシュはコピーしながら計算済みなので、キャッシュの検索・保存にそのまま渡す
+            batch_staged = [stage_uploaded_file(batch_file, subdir="batch_media") for batch_file in batch_files]
+            batch_paths = [path for path, _ in batch_staged]
+            batch_hashes = [content_hash for _, content_hash in batch_staged]
+
+            batch_progress = st.progress(0.0, text=f"0/{len(batch_paths)}件完了")
+            finished = {"count": 0}
+
+            def show_batch_result(entry):
+                finished["count"] += 1
+                batch_progress.progress(
+                    finished["count"] / len(batch_paths),
+                    text=f"{finished['count']}/{len(batch_paths)}件完了（{batch_files[entry['index']].name}）"
+                )
+
+            try:
+                with st.spinner("アップロード・文字起こし中...（すべてのジョブを並行して処理します）"):
+                    batch_results = BatchTranscriber(
+                        gladia,
+                        max_concurrency=4,
+                        output_dir=os.path.join(batch_dir, "transcripts")
+                    ).run(batch_paths, language="ja", on_result=show_batch_result, content_hashes=batch_hashes)
+
+                st.session_state.batch_results = [
+                    {"name": batch_files[r["index"]].name, "text": r["text"], "error": r["error"]}
+                    for r in batch_results
+                ]
+            finally:
+                # 動画と書き出した結果は不要なので削除（結果はセッションに保持し、ZIPもそこから作る）
+                for path in batch_paths:
+                    discard_staged_file(path)
+                shutil.rmtree(batch_dir, ignore_errors=True)
+
+    if st.session_state.get("batch_results"):
+        batch_results = st.session_state.batch_results
+        succeeded = [r for r in batch_results if r["text"] is not None]
+        st.success(f"✅ {len(succeeded)}/{len(batch_results)}件の文字起こしが完了しました")
+
+        for r in batch_results:
+            if r["text"] is not None:
+                with st.expander(f"📄 {r['name']}"):
+                    st.text(r["text"])
+            else:
+                st.error(f"❌ {r['name']}: {r['error']}")
+
+        if succeeded:
+            zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for i, r in enumerate(batch_results):
+                    if r["text"] is not None:
+                        zip_file.writestr(f"{i + 1:03d}_{os.path.splitext(r['name'])[0]}.txt", r["text"])
+            st.download_button(
+                "📥 文字起こし結果をまとめてダウンロード（ZIP）",
+                data=zip_buffer.getvalue(),
+                file_name="transcripts.zip",
+                mime="application/zip",
+                key="batch_download_btn"
+            )
+
 # セクション2: 整形済みテキスト表示
 st.markdown('<div id="formatted-text-section"></div>', unsafe_allow_html=True)
 st.header("📝 2. 整形済みテキスト + クリップ分割（編集可能）")
@@ -710,13 +994,10 @@ st.header("🎙️ 3. 音声合成")
 
 if st.session_state.formatted_text:
 
-    # スピーカー一覧を取得
-    speakers = voicevox.get_speakers()
-
-    if speakers:
-        # スピーカー名のリストを作成
-        speaker_names = [speaker.get("name", "") for speaker in speakers]
+    # スピーカー一覧を取得（キャッシュ済みの一覧を使用）
+    speaker_names = speaker_catalog.speaker_names()
 
+    if speaker_names:
         # 初期値を「青山流星」に設定（存在する場合）
         default_index = 0
         if "青山龍星" in speaker_names:
@@ -734,13 +1015,9 @@ if st.session_state.formatted_text:
             )
 
         # 選択されたスピーカーのスタイルを取得
-        selected_speaker = next(
-            (s for s in speakers if s.get("name") == selected_speaker_name),
-            None
-        )
+        styles = speaker_catalog.styles(selected_speaker_name)
 
-        if selected_speaker:
-            styles = selected_speaker.get("styles", [])
+        if styles:
             style_names = [style.get("name", "") for style in styles]
 
             with col2:
@@ -751,12 +1028,23 @@ if st.session_state.formatted_text:
                 )
 
             # スピーカーIDを取得
-            speaker_id = voicevox.find_speaker_id(
-                speakers,
+            speaker_id = speaker_catalog.find_speaker_id(
                 selected_speaker_name,
                 selected_style_name
             )
 
+            # 選択中のスピーカーのモデルを裏で読み込んでおく（初回合成の待ち時間をなくす）
+            if speaker_id is not None:
+                voicevox.warm_up_speaker(speaker_id)
+
+            # 全キャラクターの試聴音声をバックグラウンドで事前生成（試聴を即座に再生できるように）
+            if st.checkbox("🎧 全キャラクターの試聴音声を事前生成（バックグラウンド）", key="pregenerate_samples"):
+                sample_job = voicevox.pregenerate_samples()
+                if sample_job.done():
+                    st.caption("✅ 試聴音声の事前生成が完了しています")
+                else:
+                    st.caption("⏳ 試聴音声を事前生成中です（このまま操作できます）")
+
             # キャラクター試聴ボタン
             if st.button("PREVIEW VOICE", key="sample_btn"):
                 with st.spinner("サンプル音声を生成中..."):
@@ -780,8 +1068,39 @@ if st.session_state.formatted_text:
                 step=0.1
             )
 
+            # 編集中のテキストを裏で先読み合成（GENERATE時にキャッシュから即座に取り出せるように）
+            if speaker_id is not None and st.session_state.get("text_editor"):
+                # VOICEVOXの接続先が変わった（クライアントが作り直された）場合は先読みも作り直す
+                previous_synth = st.session_state.get("speculative_synth")
+                if previous_synth is None or previous_synth.voicevox is not voicevox:
+                    if previous_synth is not None:
+                        previous_synth.cancel()
+                    st.session_state.speculative_synth = SpeculativeSynthesizer(voicevox, text_segmenter)
+                st.session_state.speculative_synth.submit(st.session_state.text_editor, speaker_id, speed)
+
+            # クリップ単位合成モード：クリップごとに1回だけ合成し、全体音声は結合して作る
+            clip_synthesis = st.checkbox(
+                "🧩 クリップ単位で合成（クリップ動画生成時に再合成しない）",
+                value=True,
+                help="空行・句読点で分割した各クリップを1回だけ合成し、全体の音声はそれらを結合して作成します。"
+            )
+            clip_gap = 0.0
+            if clip_synthesis:
+                clip_gap = st.slider(
+                    "⏸️ クリップ間の無音（秒）",
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=0.2,
+                    step=0.05
+                )
+
             # 音声生成ボタン
             if st.button("GENERATE AUDIO", key="generate_btn"):
+                cancel_speculative_synthesis()
+                if not voicevox.is_alive():
+                    st.error("⚠️ VOICEVOXエンジンに接続できません。VOICEVOXが起動しているか確認してください")
+                    st.stop()
+
                 with st.spinner("音声を生成中... (時間がかかる場合があります)"):
                     # ユーザーが入力したテキスト（改行あり）を保存
                     original_text = st.session_state.text_editor
@@ -789,21 +1108,61 @@ if st.session_state.formatted_text:
                     # 音声生成用：改行を削除して1行にする（VOICEVOXの精度向上）
                     voice_text_no_breaks = original_text.replace('\n', '')
 
-                    st.info(f"💡 音声生成：改行を削除した1行テキストを使用（{len(voice_text_no_breaks)}文字）")
+                    if clip_synthesis:
+                        # クリップごとに合成して結合（クリップ動画生成時はこの音声を再利用）
+                        clip_texts = text_segmenter.split_by_punctuation(original_text)
+                        st.info(f"💡 音声生成：{len(clip_texts)}個のクリップを合成して結合（クリップ間 {clip_gap:.2f}秒）")
+
+                        # クリップ音声は作業ディレクトリに保存し、前回合成したものは削除する
+                        prepared_dir = os.path.join(st.session_state.work_dir, "prepared_clips")
+                        st.session_state.pop("prepared_clip_audios", None)
+                        shutil.rmtree(prepared_dir, ignore_errors=True)
+
+                        clip_result = voicevox.generate_voice_from_clips(
+                            clip_texts,
+                            speaker_id,
+                            prepared_dir,
+                            speed,
+                            gap_seconds=clip_gap,
+                            max_workers=4 * voicevox.engine_count
+                        )
+                        audio_data = clip_result["audio"] if clip_result else None
+                        timing_info = clip_result["timing_info"] if clip_result else None
+                        if clip_result:
+                            st.session_state.prepared_clip_audios = {
+                                "texts": clip_texts,
+                                "speaker_id": speaker_id,
+                                "speed": speed,
+                                "paths": clip_result["clip_paths"]
+                            }
+                    elif len(voice_text_no_breaks) > LONG_TEXT_THRESHOLD:
+                        # 長文は文単位に分割して並列合成（1回の音声クエリが長くなりすぎないように）
+                        st.info(f"💡 音声生成：長文のため文単位で分割して合成（{len(voice_text_no_breaks)}文字）")
+
+                        long_result = voicevox.generate_voice_long(
+                            voice_text_no_breaks,
+                            speaker_id,
+                            speed,
+                            max_workers=4 * voicevox.engine_count
+                        )
+                        audio_data = long_result["audio"] if long_result else None
+                        timing_info = long_result["timing_info"] if long_result else None
+                    else:
+                        st.info(f"💡 音声生成：改行を削除した1行テキストを使用（{len(voice_text_no_breaks)}文字）")
 
-                    # 音声生成（改行なしテキスト）
-                    audio_data = voicevox.generate_voice(
-                        voice_text_no_breaks,
-                        speaker_id,
-                        speed
-                    )
+                        # 音声生成（改行なしテキスト）
+                        audio_data = voicevox.generate_voice(
+                            voice_text_no_breaks,
+                            speaker_id,
+                            speed
+                        )
 
-                    # タイミング情報を取得（改行なしテキスト）
-                    timing_info = voicevox.get_timing_info(
-                        voice_text_no_breaks,
-                        speaker_id,
-                        speed
-                    )
+                        # タイミング情報を取得（改行なしテキスト）
+                        timing_info = voicevox.get_timing_info(
+                            voice_text_no_breaks,
+                            speaker_id,
+                            speed
+                        )
 
                     if audio_data:
                         st.session_state.generated_audio = audio_data
@@ -882,6 +1241,7 @@ if st.session_state.generated_audio:
 
     # クリップ動画生成ボタン
     if st.button("GENERATE CLIP VIDEOS", key="generate_segment_videos_btn"):
+        cancel_speculative_synthesis()
         with st.spinner(f"{len(segments)}個のクリップ動画を生成中... (時間がかかります)"):
             try:
                 # セッションステートに結果を保存するリストを初期化
@@ -900,28 +1260,68 @@ if st.session_state.generated_audio:
                 progress_bar = st.progress(0)
                 status_text = st.empty()
 
-                # 各クリップの音声と動画を生成
+                # 音声生成時にクリップ単位で合成済みなら、その音声をそのまま使う
+                prepared = st.session_state.get("prepared_clip_audios")
+                if (
+                    prepared
+                    and prepared["texts"] == segments
+                    and prepared["speaker_id"] == st.session_state.speaker_id
+                    and prepared["speed"] == st.session_state.speed
+                    and all(os.path.exists(path) for path in prepared["paths"])
+                ):
+                    voice_results = [
+                        {"index": i, "text": text, "audio": None, "path": path, "error": None}
+                        for i, (text, path) in enumerate(zip(segments, prepared["paths"]))
+                    ]
+                elif not voicevox.is_alive():
+                    # エンジンが落ちている場合は全クリップを試さずに中断する
+                    progress_bar.empty()
+                    status_text.empty()
+                    st.error("⚠️ VOICEVOXエンジンに接続できません。VOICEVOXが起動しているか確認してください")
+                    st.stop()
+                else:
+                    # 全クリップの音声を並列生成（エンコード前にまとめて合成）
+                    # 音声はメモリに載せず、セッションの作業ディレクトリへ直接書き込む
+                    status_text.text(f"{len(segments)}個のクリップの音声を合成中...")
+                    # 前回の生成で書き出したクリップ音声は作り直す前に削除する
+                    clip_audio_dir = os.path.join(st.session_state.work_dir, "clip_audio")
+                    shutil.rmtree(clip_audio_dir, ignore_errors=True)
+                    os.makedirs(clip_audio_dir, exist_ok=True)
+                    voice_results = voicevox.generate_many(
+                        segments,
+                        st.session_state.speaker_id,
+                        st.session_state.speed,
+                        max_workers=4 * voicevox.engine_count,
+                        output_dir=clip_audio_dir
+                    )
+
+                # 各クリップの動画を生成
                 for i, segment_text in enumerate(segments):
                     status_text.text(f"クリップ {i+1}/{len(segments)} を処理中...")
 
-                    # 音声生成
-                    audio_data = voicevox.generate_voice(
-                        segment_text,
-                        st.session_state.speaker_id,
-                        st.session_state.speed
-                    )
+                    audio_data = voice_results[i]["audio"]
+                    audio_path = voice_results[i]["path"]
+
+                    if audio_data or audio_path:
+                        # 合成に使った音声クエリ（キャッシュ済み）から各行の発話開始時刻を求める
+                        timing_index = voicevox.get_timing_index(
+                            segment_text,
+                            st.session_state.speaker_id,
+                            st.session_state.speed
+                        )
 
-                    if audio_data:
                         # 動画生成
                         video_data = video_gen.create_segment_video(
                             segment_text,
                             audio_data,
-                            segment_index=i
+                            segment_index=i,
+                            audio_path=audio_path,
+                            timing_index=timing_index
                         )
 
                         if video_data:
                             st.session_state.segment_videos.append(video_data)
-                            st.session_state.segment_audios.append(audio_data)
+                            st.session_state.segment_audios.append(audio_path or audio_data)
                             st.session_state.segment_texts.append(segment_text)
                         else:
                             st.error(f"クリップ{i+1}の動画生成に失敗しました")
@@ -934,6 +1334,9 @@ if st.session_state.generated_audio:
                 progress_bar.empty()
                 status_text.empty()
 
+                cache_stats = voicevox.cache.stats()
+                print(f"[VOICEVOX] 音声キャッシュ: ヒット {cache_stats['hits']} / ミス {cache_stats['misses']}")
+
                 if len(st.session_state.segment_videos) == len(segments):
                     st.success(f"✅ {len(segments)}個のクリップ動画を生成しました！")
 
@@ -1077,7 +1480,7 @@ if st.button("GENERATE SNS CONTENT", key="generate_sns_content_btn"):
         st.error("⚠️ テキストが見つかりません")
     else:
         with st.spinner("タイトル・紹介文・ハッシュタグを生成中..."):
-            sns_content = gemini.generate_metadata(st.session_state.text_editor)
+            sns_content = gemini.generate_metadata(st.session_state.text_editor, use_cache=not gemini_regenerate)
             if sns_content:
                 st.session_state.generated_sns_content = sns_content
                 st.success("✅ タイトル・紹介文・ハッシュタグを生成しました！")
@@ -1,5 +1,5 @@
 from .transcription import GladiaAPI
 from .text_formatter import GeminiFormatter
-from .voicevox import VoiceVoxAPI
+from .voicevox import VoiceVoxAPI, AsyncVoiceVoxAPI
 
-__all__ = ['GladiaAPI', 'GeminiFormatter', 'VoiceVoxAPI']
+__all__ = ['GladiaAPI', 'GeminiFormatter', 'VoiceVoxAPI', 'AsyncVoiceVoxAPI']
@@ -0,0 +1,179 @@
+"""
+文字起こし用の音声抽出ユーティリティ
+動画から音声トラックだけを取り出し、音声認識向けの小さな形式（モノラル・16kHz）に変換する
+"""
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from typing import List, Optional
+
+# 変換形式（先頭から順に試す）: (拡張子, ffmpegのエンコーダ引数)
+SPEECH_FORMATS = [
+    (".ogg", ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"]),
+    (".flac", ["-c:a", "flac", "-compression_level", "5"]),
+]
+
+
+def find_ffmpeg() -> Optional[str]:
+    """ffmpegの実行ファイルを探す（PATHになければmoviepyが使うimageio-ffmpegのものを使う）"""
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+def extract_speech_audio(
+    input_path: str,
+    output_dir: Optional[str] = None,
+    sample_rate: int = 16000,
+    timeout: float = 600.0,
+    start: Optional[float] = None,
+    duration: Optional[float] = None
+) -> Optional[str]:
+    """
+    動画ファイルから音声を抽出してモノラル・16kHzのOpus（失敗時はFLAC）に変換
+
+    変換はffmpegのサブプロセスがファイルからファイルへ行うので、
+    動画をPythonのメモリに読み込むことはない
+
+    Args:
+        input_path: 入力動画（または音声）ファイルのパス
+        output_dir: 出力先ディレクトリ（Noneの場合は一時ディレクトリ）
+        sample_rate: 出力のサンプリングレート
+        timeout: 変換1回あたりの最大秒数
+        start: 切り出し開始位置（秒）。Noneの場合は先頭から
+        duration: 切り出す長さ（秒）。Noneの場合は最後まで
+
+    Returns:
+        変換後の音声ファイルのパス（呼び出し側で削除する）。失敗時はNone
+    """
+    ffmpeg = find_ffmpeg()
+    if ffmpeg is None:
+        print("ffmpegが見つからないため、音声抽出をスキップします")
+        return None
+
+    base = os.path.splitext(os.path.basename(input_path))[0]
+    for suffix, codec_args in SPEECH_FORMATS:
+        fd, output_path = tempfile.mkstemp(prefix=f"{base}_", suffix=suffix, dir=output_dir)
+        os.close(fd)
+
+        command = [
+            ffmpeg, "-nostdin", "-y", "-loglevel", "error",
+            *_range_args(start, duration),
+            "-i", input_path,
+            "-vn", "-sn", "-dn",  # 映像・字幕・データストリームは捨てる
+            "-ac", "1", "-ar", str(sample_rate),
+            *codec_args,
+            output_path
+        ]
+        try:
+            completed = subprocess.run(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=timeout
+            )
+            if completed.returncode == 0 and os.path.getsize(output_path) > 0:
+                input_mb = os.path.getsize(input_path) / 1024 / 1024
+                output_mb = os.path.getsize(output_path) / 1024 / 1024
+                print(f"音声抽出完了: {input_mb:.1f}MB → {output_mb:.2f}MB ({suffix})")
+                return output_path
+
+            error = completed.stderr.decode("utf-8", errors="replace").strip()
+            print(f"音声抽出エラー（{suffix}）: {error[-500:]}")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"音声抽出エラー（{suffix}）: {e}")
+
+        if os.path.exists(output_path):
+            os.unlink(output_path)
+
+    return None
+
+
+def probe_duration(input_path: str, timeout: float = 30.0) -> Optional[float]:
+    """
+    メディアの長さ（秒）をコンテナのヘッダから取得（音声はデコードしない）
+
+    ffprobeはimageio-ffmpegに含まれないため、ffmpeg -i の出力の「Duration:」を読む
+
+    Returns:
+        長さ（秒）。取得できない場合はNone
+    """
+    ffmpeg = find_ffmpeg()
+    if ffmpeg is None:
+        return None
+    try:
+        # 出力先を指定しないのでffmpegは終了コード1で終わるが、入力の情報は標準エラーに出る
+        completed = subprocess.run(
+            [ffmpeg, "-nostdin", "-hide_banner", "-i", input_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"長さの取得エラー: {e}")
+        return None
+
+    match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", completed.stderr.decode("utf-8", errors="replace"))
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _range_args(start: Optional[float], duration: Optional[float]) -> List[str]:
+    """切り出し範囲のffmpeg引数（入力側に付けてシークを速くする）"""
+    args = []
+    if start:
+        args += ["-ss", f"{start:.3f}"]
+    if duration is not None:
+        args += ["-t", f"{duration:.3f}"]
+    return args
+
+
+def decode_pcm(
+    input_path: str,
+    output_dir: Optional[str] = None,
+    sample_rate: int = 16000,
+    timeout: float = 600.0
+) -> Optional[str]:
+    """
+    音声をモノラル・16bitのヘッダなしPCM（s16le）に変換してファイルに書き出す
+
+    np.memmap(path, dtype="<i2") で読めば、長い音声でもメモリに全体を載せずに解析できる
+
+    Returns:
+        PCMファイルのパス（呼び出し側で削除する）。失敗時はNone
+    """
+    ffmpeg = find_ffmpeg()
+    if ffmpeg is None:
+        print("ffmpegが見つからないため、音声のデコードをスキップします")
+        return None
+
+    fd, output_path = tempfile.mkstemp(suffix=".pcm", dir=output_dir)
+    os.close(fd)
+    command = [
+        ffmpeg, "-nostdin", "-y", "-loglevel", "error",
+        "-i", input_path,
+        "-vn", "-sn", "-dn",
+        "-ac", "1", "-ar", str(sample_rate),
+        "-f", "s16le", "-c:a", "pcm_s16le",
+        output_path
+    ]
+    try:
+        completed = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout)
+        if completed.returncode == 0:
+            return output_path
+        print(f"音声デコードエラー: {completed.stderr.decode('utf-8', errors='replace').strip()[-500:]}")
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"音声デコードエラー: {e}")
+
+    if os.path.exists(output_path):
+        os.unlink(output_path)
+    return None
@@ -0,0 +1,241 @@
+"""
+音声データ（WAV）ユーティリティ
+VOICEVOXが返すPCM WAVをNumPyで結合・計測する
+"""
+import io
+import wave
+from typing import List, Tuple
+
+import numpy as np
+
+
+def read_wav(data: bytes) -> Tuple[np.ndarray, int, int]:
+    """
+    WAVバイト列をサンプル配列に変換
+
+    Args:
+        data: WAVバイト列（16bit PCM）
+
+    Returns:
+        (サンプル配列[フレーム数, チャンネル数], サンプリングレート, チャンネル数)
+    """
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        channels = wav.getnchannels()
+        sample_rate = wav.getframerate()
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"16bit PCM以外のWAVには対応していません: {wav.getsampwidth() * 8}bit")
+        frames = wav.readframes(wav.getnframes())
+
+    samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+    return samples, sample_rate, channels
+
+
+def write_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """サンプル配列[フレーム数, チャンネル数]をWAVバイト列に変換"""
+    samples = np.asarray(samples, dtype="<i2")
+    if samples.ndim == 1:
+        samples = samples.reshape(-1, 1)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def wav_duration(data: bytes) -> float:
+    """WAVバイト列の長さ（秒）を取得"""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def concat_wavs(wavs: List[bytes], gap_seconds: float = 0.0) -> bytes:
+    """
+    複数のWAVを無音を挟んで1つに結合
+
+    Args:
+        wavs: WAVバイト列のリスト（サンプリングレート・チャンネル数は同じであること）
+        gap_seconds: クリップ間に挿入する無音の長さ（秒）
+
+    Returns:
+        結合後のWAVバイト列
+    """
+    if not wavs:
+        raise ValueError("結合するWAVがありません")
+
+    parts = []
+    sample_rate = channels = None
+    for i, data in enumerate(wavs):
+        samples, rate, ch = read_wav(data)
+        if sample_rate is None:
+            sample_rate, channels = rate, ch
+        elif (rate, ch) != (sample_rate, channels):
+            raise ValueError(f"WAV{i+1}の形式が異なります: {rate}Hz/{ch}ch（期待値: {sample_rate}Hz/{channels}ch）")
+
+        if i > 0 and gap_seconds > 0:
+            parts.append(np.zeros((int(round(gap_seconds * sample_rate)), channels), dtype="<i2"))
+        parts.append(samples)
+
+    return write_wav(np.concatenate(parts), sample_rate)
+
+
+def wav_file_duration(path: str) -> float:
+    """WAVファイルの長さ（秒）を取得（ヘッダのみ読む）"""
+    with wave.open(path, "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def concat_wav_files(paths: List[str], output_path: str, gap_seconds: float = 0.0, chunk_frames: int = 65536) -> str:
+    """
+    複数のWAVファイルを無音を挟んで1つのファイルに結合
+
+    一定フレーム数ずつ読み書きするので、クリップ全体をメモリに載せない
+
+    Args:
+        paths: WAVファイルのパスのリスト（サンプリングレート・チャンネル数は同じであること）
+        output_path: 結合後のWAVの保存先
+        gap_seconds: クリップ間に挿入する無音の長さ（秒）
+        chunk_frames: 1回に読み書きするフレーム数
+
+    Returns:
+        output_path
+    """
+    if not paths:
+        raise ValueError("結合するWAVがありません")
+
+    with wave.open(output_path, "wb") as output:
+        params = None
+        for i, path in enumerate(paths):
+            with wave.open(path, "rb") as wav:
+                rate, channels, width = wav.getframerate(), wav.getnchannels(), wav.getsampwidth()
+                if params is None:
+                    params = (rate, channels, width)
+                    output.setframerate(rate)
+                    output.setnchannels(channels)
+                    output.setsampwidth(width)
+                elif (rate, channels, width) != params:
+                    raise ValueError(f"WAV{i+1}の形式が異なります: {rate}Hz/{channels}ch（期待値: {params[0]}Hz/{params[1]}ch）")
+
+                if i > 0 and gap_seconds > 0:
+                    output.writeframes(b"\0" * (int(round(gap_seconds * rate)) * channels * width))
+                for frames in iter(lambda: wav.readframes(chunk_frames), b""):
+                    output.writeframes(frames)
+    return output_path
+
+
+def frame_rms(samples: np.ndarray, sample_rate: int, frame_seconds: float = 0.1) -> np.ndarray:
+    """
+    フレームごとのRMSを計算（端数のサンプルは捨てる）
+
+    大きな配列を一度にfloat化しないようブロック単位で計算するので、np.memmapをそのまま渡せる
+    """
+    samples = np.asarray(samples).reshape(-1)
+    frame = max(1, int(sample_rate * frame_seconds))
+    n_frames = len(samples) // frame
+
+    rms = np.empty(n_frames, dtype=np.float32)
+    block = max(1, (1 << 20) // frame)
+    for begin in range(0, n_frames, block):
+        end = min(begin + block, n_frames)
+        frames = samples[begin * frame:end * frame].reshape(-1, frame).astype(np.float32)
+        rms[begin:end] = np.sqrt(np.mean(frames * frames, axis=1))
+    return rms
+
+
+def find_speech_segments(
+    samples: np.ndarray,
+    sample_rate: int,
+    min_silence: float = 1.0,
+    threshold_db: float = -45.0,
+    padding: float = 0.25,
+    frame_seconds: float = 0.02
+) -> List[Tuple[float, float]]:
+    """
+    min_silence秒以上続く無音を除いた、残すべき区間（秒）を求める
+
+    Args:
+        samples: モノラルの16bitサンプル配列（np.memmapでもよい）
+        sample_rate: サンプリングレート
+        min_silence: これ以上続く無音だけを取り除く（秒）
+        threshold_db: これより小さい音量（dBFS）のフレームを無音とみなす
+        padding: 発話の前後に残す無音の長さ（秒）
+        frame_seconds: 音量を計算するフレームの長さ（秒）
+
+    Returns:
+        (開始秒, 終了秒) のリスト（元の音声の時刻）
+    """
+    rms = frame_rms(samples, sample_rate, frame_seconds)
+    if len(rms) == 0:
+        return []
+
+    db = 20 * np.log10(rms / 32768.0 + 1e-10)
+    silent = np.concatenate(([False], db < threshold_db, [False]))
+
+    # 無音が続く区間の開始・終了フレーム
+    edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+    silence_starts, silence_ends = edges[0::2], edges[1::2]
+
+    min_frames = int(round(min_silence / frame_seconds))
+    pad_frames = int(round(padding / frame_seconds))
+    long_silence = (silence_ends - silence_starts) >= min_frames
+
+    # 長い無音の内側（前後のpaddingを残した部分）を取り除く
+    cut_starts = silence_starts[long_silence] + pad_frames
+    cut_ends = silence_ends[long_silence] - pad_frames
+    cut_starts[silence_starts[long_silence] == 0] = 0
+    cut_ends[silence_ends[long_silence] == len(rms)] = len(rms)
+
+    keep_starts = np.concatenate(([0], cut_ends))
+    keep_ends = np.concatenate((cut_starts, [len(rms)]))
+    keep = keep_ends > keep_starts
+
+    duration = len(samples) / sample_rate
+    return [
+        (round(float(start * frame_seconds), 3), round(float(min(end * frame_seconds, duration)), 3))
+        for start, end in zip(keep_starts[keep], keep_ends[keep])
+    ]
+
+
+def find_silence_splits(
+    samples: np.ndarray,
+    sample_rate: int,
+    target_seconds: float = 300.0,
+    search_seconds: float = 30.0,
+    frame_seconds: float = 0.1
+) -> List[float]:
+    """
+    長い音声を分割する位置（秒）を、目標の長さ付近で最も音量の小さい箇所から選ぶ
+
+    Args:
+        samples: モノラルのサンプル配列（np.memmapでもよい）
+        sample_rate: サンプリングレート
+        target_seconds: 1チャンクの目標の長さ（秒）
+        search_seconds: 目標位置の前後で無音を探す範囲（秒）
+        frame_seconds: RMSを計算するフレームの長さ（秒）
+
+    Returns:
+        分割位置（秒）のリスト（分割不要の場合は空）
+    """
+    rms = frame_rms(samples, sample_rate, frame_seconds)
+    n_frames = len(rms)
+    if n_frames == 0:
+        return []
+
+    # 一瞬の途切れではなく、ある程度続く静かな箇所を選ぶため平滑化する
+    rms = np.convolve(rms, np.ones(5, dtype=np.float32) / 5, mode="same")
+
+    duration = n_frames * frame_seconds
+    splits = []
+    position = 0.0
+    while duration - position > target_seconds * 1.5:
+        center = position + target_seconds
+        lo = int(max(position + target_seconds / 2, center - search_seconds) / frame_seconds)
+        hi = int(min(duration - target_seconds / 2, center + search_seconds) / frame_seconds)
+        if hi <= lo:
+            break
+        position = (lo + int(np.argmin(rms[lo:hi])) + 0.5) * frame_seconds
+        splits.append(position)
+
+    return splits
@@ -0,0 +1,194 @@
+"""
+複数動画の一括文字起こし
+アップロードとジョブ登録を並列に行い、登録済みのジョブはまとめて1つのループでポーリングする
+"""
+import json
+import os
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from .transcription import GladiaAPI, full_transcript
+
+
+class BatchTranscriber:
+    def __init__(
+        self,
+        gladia: GladiaAPI,
+        max_concurrency: int = 4,
+        output_dir: Optional[str] = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 10.0,
+        base_timeout: float = 300.0,
+        timeout_per_media_second: float = 1.0
+    ):
+        """
+        Args:
+            gladia: GladiaAPIクライアント
+            max_concurrency: 同時に行うアップロード（音声抽出を含む）の最大数
+            output_dir: 完了した結果を書き出すディレクトリ（Noneの場合は書き出さない）
+            initial_interval: ポーリングの最初の間隔（秒）
+            max_interval: ポーリングの最大間隔（秒）
+            base_timeout: 1ジョブの待機の上限（秒、音声の長さの分だけ伸ばす）
+            timeout_per_media_second: 音声1秒あたりに伸ばす待機時間（秒）
+        """
+        self.gladia = gladia
+        self.max_concurrency = max_concurrency
+        self.output_dir = output_dir
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.base_timeout = base_timeout
+        self.timeout_per_media_second = timeout_per_media_second
+
+    def _submit(self, file_path: str, language: str) -> Optional[str]:
+        """1ファイルをアップロードしてジョブを登録（ワーカースレッドで実行）"""
+        audio_url = self.gladia.upload_file(file_path)
+        if not audio_url:
+            return None
+        return self.gladia.submit_transcription(audio_url, language)
+
+    def _write_output(self, entry: Dict):
+        """完了した結果をテキストとJSONで書き出す"""
+        if not self.output_dir:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        # 同じファイル名の動画があっても上書きしないよう番号を付ける
+        name = os.path.splitext(os.path.basename(entry["path"]))[0]
+        base = os.path.join(self.output_dir, f"{entry['index'] + 1:03d}_{name}")
+        try:
+            with open(base + ".txt", "w", encoding="utf-8") as f:
+                f.write(entry["text"])
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump(entry["result"], f, ensure_ascii=False)
+            entry["output_path"] = base + ".txt"
+        except OSError as e:
+            print(f"結果の書き出しエラー（{entry['path']}）: {e}")
+
+    def run(
+        self,
+        file_paths: List[str],
+        language: str = "ja",
+        on_result: Optional[Callable[[Dict], None]] = None,
+        content_hashes: Optional[List[Optional[str]]] = None
+    ) -> List[Dict]:
+        """
+        複数のファイルを一括で文字起こし
+
+        アップロードは最大max_concurrency件ずつ並列に行い、登録できたジョブから順に
+        共通のポーリングループに加える。完了したものから結果を書き出し、on_resultを呼ぶ
+        （on_resultはrunを呼んだスレッドで呼ばれる）
+
+        Args:
+            file_paths: 文字起こしするファイルのパス
+            language: 言語コード
+            on_result: 1件終わるごとに結果を受け取るコールバック
+            content_hashes: 各ファイル内容のSHA-256（計算済みの場合。キャッシュの検索・保存でファイルを読み直さない）
+
+        Returns:
+            入力と同じ順序の結果リスト
+            [{"index", "path", "text", "result", "error", "output_path"}, ...]
+        """
+        entries = [
+            {"index": i, "path": path, "text": None, "result": None, "error": None, "output_path": None}
+            for i, path in enumerate(file_paths)
+        ]
+        remaining = len(entries)
+        hashes = list(content_hashes) if content_hashes is not None else [None] * len(entries)
+
+        def finish(entry: Dict, result: Optional[Dict] = None, error: Optional[str] = None):
+            nonlocal remaining
+            remaining -= 1
+            if result is not None:
+                entry["result"] = result
+                entry["text"] = full_transcript(result)
+                self._write_output(entry)
+            else:
+                entry["error"] = error
+                print(f"[一括文字起こし] {os.path.basename(entry['path'])}: {error}")
+            if on_result:
+                on_result(entry)
+
+        # 保存済みの結果があるものはアップロードしない
+        to_submit = []
+        for entry in entries:
+            cached = self.gladia.get_cached_file_result(entry["path"], language, hashes[entry["index"]])
+            if cached is not None:
+                finish(entry, cached)
+            else:
+                to_submit.append(entry)
+
+        submissions: Dict[Future, Dict] = {}
+        # result_id -> {"entry", "started", "duration", "next_poll", "interval"}
+        pending: Dict[str, Dict] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for entry in to_submit:
+                submissions[executor.submit(self._submit, entry["path"], language)] = entry
+
+            while remaining > 0:
+                now = time.monotonic()
+
+                # 登録が終わったジョブをポーリング対象に加える
+                for future in [f for f in submissions if f.done()]:
+                    entry = submissions.pop(future)
+                    try:
+                        result_id = future.result()
+                    except Exception as e:
+                        result_id = None
+                        print(f"[一括文字起こし] 登録エラー: {e}")
+                    if result_id:
+                        pending[result_id] = {
+                            "entry": entry,
+                            "started": now,
+                            "duration": None,
+                            "next_poll": now + self.initial_interval,
+                            "interval": self.initial_interval
+                        }
+                    else:
+                        finish(entry, error="アップロードまたはジョブ登録に失敗しました")
+
+                # 確認時刻になったジョブだけを1回ずつ確認する
+                for result_id, job in list(pending.items()):
+                    if job["next_poll"] > now:
+                        continue
+                    try:
+                        result = self.gladia.get_result(result_id)
+                    except Exception as e:
+                        print(f"[一括文字起こし] 結果取得エラー（再試行します）: {e}")
+                        result = {}
+
+                    status = result.get("status")
+                    if status == "done":
+                        del pending[result_id]
+                        self.gladia.store_file_result(job["entry"]["path"], language, result, hashes[job["entry"]["index"]])
+                        finish(job["entry"], result)
+                        continue
+                    if status == "error":
+                        del pending[result_id]
+                        finish(job["entry"], error=f"文字起こしエラー: {result.get('error_code') or result.get('error', '不明なエラー')}")
+                        continue
+
+                    if job["duration"] is None:
+                        job["duration"] = (result.get("file") or {}).get("audio_duration")
+                    deadline = self.base_timeout + self.timeout_per_media_second * (job["duration"] or 0.0)
+                    if now - job["started"] > deadline:
+                        del pending[result_id]
+                        finish(job["entry"], error="タイムアウト: 文字起こしが完了しませんでした")
+                        continue
+
+                    job["interval"] = min(job["interval"] * 1.5, self.max_interval)
+                    job["next_poll"] = now + job["interval"] * random.uniform(0.8, 1.2)
+
+                if remaining == 0:
+                    break
+
+                # 次に確認するジョブの時刻まで待つ（登録待ちがあれば短い間隔で見に行く）
+                wait = self.max_interval
+                if pending:
+                    wait = min(wait, min(job["next_poll"] for job in pending.values()) - time.monotonic())
+                if submissions:
+                    wait = min(wait, 0.2)
+                time.sleep(max(0.05, wait))
+
+        print(f"[一括文字起こし] 完了: 成功 {sum(1 for e in entries if e['result'])}/{len(entries)}件")
+        return entries
@@ -0,0 +1,119 @@
+"""
+文字起こし完了コールバックの受信サーバー
+GladiaがPOSTする完了通知をローカルのHTTPサーバーで受け取り、待機中のスレッドを起こす
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+CALLBACK_PATH = "/gladia/callback"
+
+
+def is_local_url(url: str) -> bool:
+    """URLのホストがこのマシン（localhost・ループバック）かどうか"""
+    host = (urlparse(url).hostname or "").lower()
+    return host == "localhost" or host == "::1" or host.startswith("127.")
+
+
+class CallbackReceiver:
+    def __init__(self, host: Optional[str] = None, port: int = 0, public_url: Optional[str] = None):
+        """
+        Args:
+            host: 待ち受けるアドレス（Noneの場合、公開URLがあれば全てのアドレス、なければ127.0.0.1のみ）
+            port: 待ち受けるポート（0で空いているポートを自動選択）
+            public_url: Gladiaから到達できるコールバックURL（トンネル等を使う場合。Noneの場合はローカルのURL）
+        """
+        if host is None:
+            # 公開URLがない場合に届くのは同じマシンのAPIだけなので、外部には公開しない
+            host = "0.0.0.0" if public_url else "127.0.0.1"
+        self.host = host
+        self.port = port
+        self.public_url = public_url
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._events: Dict[str, threading.Event] = {}
+        self._payloads: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def is_reachable_from(self, api_base_url: str) -> bool:
+        """
+        APIサーバーからコールバックURLに到達できるか
+
+        公開URLがない場合のローカルのURLは、同じマシンで動くAPI（テスト用サーバー等）からしか届かない
+        """
+        return bool(self.public_url) or is_local_url(api_base_url)
+
+    @property
+    def url(self) -> str:
+        """Gladiaに渡すコールバックURL"""
+        self.start()
+        if self.public_url:
+            return self.public_url
+        host = "127.0.0.1" if self.host in ("0.0.0.0", "") else self.host
+        return f"http://{host}:{self.port}{CALLBACK_PATH}"
+
+    def start(self):
+        """受信サーバーを起動（起動済みの場合は何もしない）"""
+        with self._lock:
+            if self._server is not None:
+                return
+
+            receiver = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_POST(self):
+                    length = int(self.headers.get("Content-Length") or 0)
+                    try:
+                        body = json.loads(self.rfile.read(length) or b"{}")
+                    except ValueError:
+                        body = {}
+
+                    result_id = body.get("id") or body.get("request_id") or (body.get("payload") or {}).get("id")
+                    if self.path.split("?")[0] != CALLBACK_PATH or not result_id:
+                        self.send_response(400)
+                        self.end_headers()
+                        return
+
+                    receiver._notify(result_id, body)
+                    self.send_response(200)
+                    self.end_headers()
+
+                def log_message(self, format, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self.port = self._server.server_address[1]
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            print(f"コールバック受信サーバー起動: {self.host}:{self.port}")
+
+    def _event(self, result_id: str) -> threading.Event:
+        with self._lock:
+            return self._events.setdefault(result_id, threading.Event())
+
+    def _notify(self, result_id: str, body: Dict):
+        with self._lock:
+            self._payloads[result_id] = body
+        self._event(result_id).set()
+
+    def register(self, result_id: str) -> threading.Event:
+        """
+        結果IDの完了通知を待つためのイベントを取得
+
+        リクエスト送信直後に通知が届いても取りこぼさないよう、通知はIDごとに保持しておく
+        """
+        return self._event(result_id)
+
+    def pop(self, result_id: str) -> Optional[Dict]:
+        """受け取った通知の本文を取り出し、そのIDの記録を削除"""
+        with self._lock:
+            self._events.pop(result_id, None)
+            return self._payloads.pop(result_id, None)
+
+    def close(self):
+        """受信サーバーを停止"""
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
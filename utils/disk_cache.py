@@ -0,0 +1,209 @@
+"""
+ディスクキャッシュユーティリティ
+内容アドレス（ハッシュキー）でバイト列を保存し、容量上限を超えたらLRUで削除
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """ファイルのSHA-256を少しずつ読みながら計算（ファイル全体をメモリに載せない）"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 500 * 1024 * 1024,
+        suffix: str = ".bin",
+        ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            directory: キャッシュを保存するディレクトリ
+            max_bytes: キャッシュ全体の容量上限（バイト）
+            suffix: 保存ファイルの拡張子
+            ttl: 書き込みからの有効期間（秒）。Noneの場合は期限なし
+        """
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 合計サイズの概算（Noneの場合は次回の書き込み時にディレクトリを走査）
+        self._total_bytes: Optional[int] = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """任意の値（JSON化できるもの）からキャッシュキーを生成"""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def _expired(self, st: os.stat_result) -> bool:
+        return self.ttl is not None and time.time() - st.st_mtime > self.ttl
+
+    def contains(self, key: str) -> bool:
+        """キャッシュ済みかを確認（ヒット数・LRU順序は変更しない）"""
+        try:
+            return not self._expired(os.stat(self._path(key)))
+        except OSError:
+            return False
+
+    def get_path(self, key: str) -> Optional[str]:
+        """
+        キャッシュ済みファイルのパスを取得（ヒット時はLRU順序を更新）
+
+        Returns:
+            ファイルパス（未キャッシュの場合はNone）
+        """
+        path = self._path(key)
+        hit = False
+        try:
+            st = os.stat(path)
+            if self._expired(st):
+                # 期限切れのエントリは削除してミス扱い
+                os.unlink(path)
+                with self._lock:
+                    if self._total_bytes is not None:
+                        self._total_bytes -= st.st_size
+            else:
+                # atimeを最終アクセス時刻として使う（mtimeは書き込み時刻のまま残す）
+                os.utime(path, (time.time(), st.st_mtime))
+                hit = True
+        except OSError:
+            pass
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return path if hit else None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """キャッシュからデータを取得"""
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> Optional[str]:
+        """
+        データをキャッシュに保存（一時ファイルに書いてからリネームするので途中状態は見えない）
+
+        Returns:
+            保存先のパス（失敗時はNone）
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"キャッシュ書き込みエラー: {e}")
+            if 'tmp_path' in locals() and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return None
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(data)
+            needs_scan = self._total_bytes is None or self._total_bytes > self.max_bytes
+        if needs_scan:
+            self._evict()
+        return path
+
+    def put_file(self, key: str, src_path: str) -> Optional[str]:
+        """
+        ファイルをキャッシュにコピー（メモリに読み込まずに保存）
+
+        Returns:
+            保存先のパス（失敗時はNone）
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(src_path, tmp_path)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"キャッシュ書き込みエラー: {e}")
+            if 'tmp_path' in locals() and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return None
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            needs_scan = self._total_bytes is None or self._total_bytes > self.max_bytes
+        if needs_scan:
+            self._evict()
+        return path
+
+    def _evict(self):
+        """期限切れのエントリと、容量上限を超えた分を最終アクセスが古い順に削除"""
+        with self._lock:
+            entries = []
+            total = 0
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith(self.suffix):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                        if self._expired(st):
+                            os.unlink(path)
+                            continue
+                    except OSError:
+                        continue
+                    entries.append((st.st_atime, st.st_size, path))
+                    total += st.st_size
+
+            if total > self.max_bytes:
+                entries.sort()
+                for _, size, path in entries:
+                    if total <= self.max_bytes:
+                        break
+                    try:
+                        os.unlink(path)
+                        total -= size
+                    except OSError:
+                        pass
+
+            self._total_bytes = total
+
+    def stats(self) -> Dict:
+        """ヒット数・ミス数を取得"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,116 @@
+"""
+文字起こし前の無音カット
+長い無音を取り除いた音声を作り、カット後の時刻を元の動画の時刻に戻す対応表を保持する
+"""
+import bisect
+import os
+import tempfile
+import wave
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .audio_extractor import decode_pcm
+from .audio_utils import find_speech_segments
+
+
+class OffsetMap:
+    def __init__(self, segments: List[Tuple[float, float]], original_duration: Optional[float] = None):
+        """
+        Args:
+            segments: 残した区間 (元の開始秒, 元の終了秒) のリスト（時刻順）
+            original_duration: 元の音声の長さ（秒）
+        """
+        self.segments = segments
+        self.original_duration = original_duration if original_duration is not None else (segments[-1][1] if segments else 0.0)
+        # 各区間がカット後の音声で始まる時刻
+        self.trimmed_starts = []
+        position = 0.0
+        for start, end in segments:
+            self.trimmed_starts.append(position)
+            position += end - start
+        self.trimmed_duration = position
+
+    @property
+    def removed_seconds(self) -> float:
+        """取り除いた無音の合計（秒）"""
+        return max(0.0, self.original_duration - self.trimmed_duration)
+
+    def to_original(self, t: float) -> float:
+        """カット後の音声の時刻を元の動画の時刻に変換（二分探索）"""
+        if not self.segments:
+            return t
+        i = max(0, bisect.bisect_right(self.trimmed_starts, t) - 1)
+        start, end = self.segments[i]
+        return min(start + (t - self.trimmed_starts[i]), end)
+
+    def to_dict(self) -> Dict:
+        return {"segments": [list(segment) for segment in self.segments], "removed_seconds": self.removed_seconds}
+
+
+def trim_silence(
+    input_path: str,
+    output_dir: Optional[str] = None,
+    sample_rate: int = 16000,
+    min_silence: float = 1.0,
+    threshold_db: float = -45.0,
+    min_saving: float = 0.05
+) -> Optional[Tuple[str, OffsetMap]]:
+    """
+    動画（または音声）から長い無音を取り除いたモノラルWAVを作成
+
+    デコードしたPCMはnp.memmapで扱い、残す区間だけを順にWAVへ書き出すので
+    長い音声でもメモリに全体を載せない
+
+    Args:
+        input_path: 入力ファイルのパス
+        output_dir: 出力先ディレクトリ（Noneの場合は一時ディレクトリ）
+        sample_rate: 出力のサンプリングレート
+        min_silence: これ以上続く無音だけを取り除く（秒）
+        threshold_db: これより小さい音量（dBFS）を無音とみなす
+        min_saving: 取り除ける割合がこれ未満ならカットしない
+
+    Returns:
+        (カット後のWAVのパス, OffsetMap)。カット不要・失敗時はNone
+    """
+    pcm_path = decode_pcm(input_path, output_dir=output_dir, sample_rate=sample_rate)
+    if pcm_path is None:
+        return None
+
+    samples = None
+    output_path = None
+    try:
+        if os.path.getsize(pcm_path) < 2:
+            return None
+        samples = np.memmap(pcm_path, dtype="<i2", mode="r")
+        duration = len(samples) / sample_rate
+        segments = find_speech_segments(samples, sample_rate, min_silence=min_silence, threshold_db=threshold_db)
+        if not segments:
+            print("無音カット: 音声が検出されなかったため、カットしません")
+            return None
+
+        offset_map = OffsetMap(segments, duration)
+        saving = offset_map.removed_seconds / duration if duration > 0 else 0.0
+        if saving < min_saving:
+            print(f"無音カット: 無音が少ないためカットしません（{saving:.1%}）")
+            return None
+
+        fd, output_path = tempfile.mkstemp(suffix=".wav", dir=output_dir)
+        os.close(fd)
+        with wave.open(output_path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            for start, end in segments:
+                wav.writeframes(np.ascontiguousarray(samples[int(start * sample_rate):int(end * sample_rate)]).tobytes())
+
+        print(f"無音カット: {duration:.1f}秒 → {offset_map.trimmed_duration:.1f}秒（{saving:.1%}削減）")
+        return output_path, offset_map
+    except (OSError, ValueError, wave.Error) as e:
+        print(f"無音カットエラー: {e}")
+        # 書き込み途中のWAVは残さない
+        if output_path is not None and os.path.exists(output_path):
+            os.unlink(output_path)
+        return None
+    finally:
+        # マッピングを開いたままではWindowsでファイルを削除できないため、先に解放する
+        del samples
+        os.unlink(pcm_path)
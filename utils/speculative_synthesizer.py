@@ -0,0 +1,116 @@
+"""
+先読み音声合成
+テキスト編集中にエンジンの空き時間を使い、確定したクリップを事前に合成してキャッシュへ入れる
+"""
+import threading
+import time
+from typing import Optional, Tuple
+
+from .text_segmenter import TextSegmenter
+from .voicevox import VoiceVoxAPI
+
+
+class SpeculativeSynthesizer:
+    def __init__(
+        self,
+        voicevox: VoiceVoxAPI,
+        segmenter: Optional[TextSegmenter] = None,
+        debounce: float = 2.0,
+        idle_timeout: float = 60.0
+    ):
+        """
+        Args:
+            voicevox: VOICEVOXクライアント（ディスクキャッシュが設定されていること）
+            segmenter: クリップ分割に使うTextSegmenter（動画生成時と同じ分割にする）
+            debounce: 最後の編集からこの秒数テキストが変わらなければ合成を始める
+            idle_timeout: この秒数新しいテキストが来なければワーカーを終了する
+        """
+        self.voicevox = voicevox
+        self.segmenter = segmenter or TextSegmenter(min_chars=10, max_chars=150)
+        self.debounce = debounce
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._request: Optional[Tuple[str, int, float]] = None
+        self._generation = 0
+        self._submitted_at = 0.0
+        self._worker: Optional[threading.Thread] = None
+        self.synthesized = 0
+
+    def submit(self, text: str, speaker_id: int, speed: float):
+        """
+        現在のテキストを登録（同じ内容なら何もしない）
+
+        以前のテキストに対する未完了の合成は、次のクリップに進む前に打ち切られる
+        """
+        if self.voicevox.cache is None or not text.strip():
+            return
+
+        request = (text, speaker_id, speed)
+        with self._lock:
+            if request == self._request:
+                return
+            self._request = request
+            self._generation += 1
+            self._submitted_at = time.monotonic()
+
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+        self._wakeup.set()
+
+    def cancel(self):
+        """登録済みのテキストを破棄し、実行中の先読みを打ち切る"""
+        with self._lock:
+            self._request = None
+            self._generation += 1
+        self._wakeup.set()
+
+    def _is_current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def _run(self):
+        processed_generation = 0
+        while True:
+            woke = self._wakeup.wait(self.idle_timeout)
+            self._wakeup.clear()
+            with self._lock:
+                if self._generation == processed_generation:
+                    if not woke:
+                        # 待っている間に新しいテキストが来なかったので終了
+                        self._worker = None
+                        return
+                    # 処理済みのテキストに対する通知は無視する
+                    continue
+
+            # デバウンス：最後の登録からdebounce秒たつまで待つ
+            while True:
+                with self._lock:
+                    remaining = self._submitted_at + self.debounce - time.monotonic()
+                    generation = self._generation
+                    request = self._request
+                if remaining <= 0:
+                    break
+                time.sleep(remaining)
+
+            processed_generation = generation
+            if request is None:
+                continue
+            self._synthesize(request, generation)
+
+    def _synthesize(self, request: Tuple[str, int, float], generation: int):
+        text, speaker_id, speed = request
+        segments = self.segmenter.split_by_punctuation(text)
+
+        for segment in segments:
+            # テキストが変わっていたら残りは捨てる
+            if not self._is_current(generation):
+                return
+            if self.voicevox.is_voice_cached(segment, speaker_id, speed):
+                continue
+            if self.voicevox.generate_voice(segment, speaker_id, speed) is not None:
+                self.synthesized += 1
+
+        print(f"[先読み合成] {len(segments)}クリップの準備完了（累計 {self.synthesized}クリップを先読み合成）")
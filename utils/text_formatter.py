@@ -1,13 +1,65 @@
 import google.generativeai as genai
 from typing import Optional
+from .disk_cache import DiskCache
+
+# プロンプトを変更したら該当するバージョンを上げる（古いキャッシュを使わないため）
+PROMPT_VERSIONS = {
+    "format_text": 1,
+    "generate_filename": 1,
+    "generate_metadata": 1,
+}
+
+
+class _CachedResponse:
+    """キャッシュから復元したレスポンス（generate_contentの戻り値と同じくtextを持つ）"""
+
+    def __init__(self, text: str):
+        self.text = text
 
 
 class GeminiFormatter:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, model_name: str = 'gemini-2.5-flash', cache: Optional[DiskCache] = None):
+        """
+        Args:
+            api_key: Gemini APIキー
+            model_name: 使用するモデル名
+            cache: レスポンスのディスクキャッシュ（Noneの場合はキャッシュしない）
+        """
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+        self.cache = cache
+
+    def _generate_content(self, kind: str, prompt: str, use_cache: bool = True):
+        """
+        generate_contentを呼び出す（同じモデル・プロンプトのバージョン・入力ならキャッシュを返す）
 
-    def format_text(self, text: str) -> Optional[str]:
+        Args:
+            kind: 呼び出し元の種類（PROMPT_VERSIONSのキー）
+            prompt: プロンプト（入力テキストを含む）
+            use_cache: Falseの場合はキャッシュを読まずに生成し直す（結果は保存する）
+        """
+        key = None
+        if self.cache is not None:
+            key = DiskCache.make_key("gemini", self.model_name, kind, PROMPT_VERSIONS[kind], prompt)
+            if use_cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    print(f"Geminiキャッシュを使用: {kind}")
+                    return _CachedResponse(cached.decode("utf-8"))
+
+        response = self.model.generate_content(prompt)
+
+        if key is not None:
+            try:
+                text = response.text
+            except Exception:
+                text = None
+            if text:
+                self.cache.put(key, text.encode("utf-8"))
+        return response
+
+    def format_text(self, text: str, use_cache: bool = True) -> Optional[str]:
         """
         テキストを14文字/行に整形
         重要: 元の発言内容は1文字も変えず、句読点と改行のみを調整
@@ -53,7 +105,7 @@ class GeminiFormatter:
 
         try:
             print(f"Gemini APIリクエスト中... (テキスト長: {len(text)}文字)")
-            response = self.model.generate_content(prompt)
+            response = self._generate_content("format_text", prompt, use_cache)
             print(f"Gemini APIレスポンス受信完了")
 
             # レスポンスの内容を確認
@@ -78,7 +130,7 @@ class GeminiFormatter:
             traceback.print_exc()
             return None
 
-    def generate_filename(self, formatted_text: str) -> Optional[str]:
+    def generate_filename(self, formatted_text: str, use_cache: bool = True) -> Optional[str]:
         """
         整形済みテキストの1〜3行目から、20文字以内の適切なファイル名を生成
         """
@@ -103,7 +155,7 @@ class GeminiFormatter:
 
         try:
             print(f"Gemini APIでファイル名生成中...")
-            response = self.model.generate_content(prompt)
+            response = self._generate_content("generate_filename", prompt, use_cache)
             print(f"ファイル名生成レスポンス受信完了")
 
             if hasattr(response, 'text'):
@@ -127,7 +179,7 @@ class GeminiFormatter:
             traceback.print_exc()
             return None
 
-    def generate_metadata(self, text: str) -> Optional[str]:
+    def generate_metadata(self, text: str, use_cache: bool = True) -> Optional[str]:
         """
         テキストからタイトル案、紹介文案、ハッシュタグを生成
 
@@ -171,7 +223,7 @@ class GeminiFormatter:
 
         try:
             print(f"Gemini APIでメタデータ生成中... (テキスト長: {len(text)}文字)")
-            response = self.model.generate_content(prompt)
+            response = self._generate_content("generate_metadata", prompt, use_cache)
             print(f"メタデータ生成レスポンス受信完了")
 
             if hasattr(response, 'text'):
@@ -44,24 +44,7 @@ class TextSegmenter:
             return result
 
         # 空行がない場合は、句読点で分割してグループ化
-        # 句読点で分割（句読点を含めて分割）
-        segments = re.split(r'([。！？])', text)
-
-        # 句読点を前のクリップに結合
-        sentences = []
-        for i in range(0, len(segments) - 1, 2):
-            sentence = segments[i]
-            if i + 1 < len(segments):
-                sentence += segments[i + 1]  # 句読点を追加
-            sentence = sentence.strip()
-            if sentence:
-                sentences.append(sentence)
-
-        # 最後のクリップ（句読点なし）を追加
-        if len(segments) % 2 == 1:
-            last_seg = segments[-1].strip()
-            if last_seg:
-                sentences.append(last_seg)
+        sentences = self.split_sentences(text)
 
         # 5〜10行になるようにグループ化
         target_min_lines = 5
@@ -104,6 +87,37 @@ class TextSegmenter:
 
         return result
 
+    def split_sentences(self, text: str) -> List[str]:
+        """
+        文末の句読点（。！？）で文に分割
+
+        Args:
+            text: 入力テキスト
+
+        Returns:
+            文のリスト（句読点は各文の末尾に残す）
+        """
+        # 句読点で分割（句読点を含めて分割）
+        segments = re.split(r'([。！？])', text)
+
+        # 句読点を前のクリップに結合
+        sentences = []
+        for i in range(0, len(segments) - 1, 2):
+            sentence = segments[i]
+            if i + 1 < len(segments):
+                sentence += segments[i + 1]  # 句読点を追加
+            sentence = sentence.strip()
+            if sentence:
+                sentences.append(sentence)
+
+        # 最後のクリップ（句読点なし）を追加
+        if len(segments) % 2 == 1:
+            last_seg = segments[-1].strip()
+            if last_seg:
+                sentences.append(last_seg)
+
+        return sentences
+
     def _merge_short_segments(self, segments: List[str]) -> List[str]:
         """
         短すぎるクリップを前のクリップと結合
@@ -0,0 +1,163 @@
+"""
+モーラ単位のタイミングインデックス
+VOICEVOXの音声クエリから各モーラの開始・終了時刻と、元テキストの文字位置との対応を作成
+"""
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# 息継ぎ（pause_mora）が入る句読点
+PAUSE_PUNCTUATION = "、。，．！？!?…"
+
+
+class TimingIndex:
+    def __init__(
+        self,
+        mora_texts: List[str],
+        starts: np.ndarray,
+        ends: np.ndarray,
+        mora_char_starts: np.ndarray,
+        duration: float
+    ):
+        """
+        Args:
+            mora_texts: 各モーラのカナ
+            starts: 各モーラの開始時刻（秒）
+            ends: 各モーラの終了時刻（秒）
+            mora_char_starts: 各モーラに対応する元テキストの文字位置（単調増加）
+            duration: 音声全体の長さ（前後の無音を含む、秒）
+        """
+        self.mora_texts = mora_texts
+        self.starts = starts
+        self.ends = ends
+        self.mora_char_starts = mora_char_starts
+        self.duration = duration
+
+    @classmethod
+    def from_query(cls, audio_query: Dict, text: str, speed: Optional[float] = None) -> "TimingIndex":
+        """
+        音声クエリからタイミングインデックスを作成
+
+        Args:
+            audio_query: /audio_query のレスポンス
+            text: 音声クエリの元になったテキスト（文字位置の対応付けに使用）
+            speed: 話速（Noneの場合はクエリのspeedScale）
+
+        Returns:
+            TimingIndex
+        """
+        speed = speed or audio_query.get("speedScale", 1.0) or 1.0
+        pause_scale = audio_query.get("pauseLengthScale", 1.0)
+        pause_override = audio_query.get("pauseLength")
+
+        # エンジンと同じく、前後の無音も含めて全ての長さを話速で割る
+        lengths = []
+        is_pause = []
+        mora_texts = []
+        phrase_groups = []  # 息継ぎで区切ったフレーズのまとまりごとのモーラ数
+        group_moras = 0
+
+        for phrase in audio_query.get("accent_phrases", []):
+            for mora in phrase.get("moras", []):
+                lengths.append((mora.get("consonant_length") or 0.0) + (mora.get("vowel_length") or 0.0))
+                is_pause.append(False)
+                mora_texts.append(mora.get("text", ""))
+                group_moras += 1
+
+            pause_mora = phrase.get("pause_mora")
+            if pause_mora:
+                pause_length = pause_override if pause_override is not None else (pause_mora.get("vowel_length") or 0.0) * pause_scale
+                lengths.append(pause_length)
+                is_pause.append(True)
+                mora_texts.append("")
+                phrase_groups.append(group_moras)
+                group_moras = 0
+
+        if group_moras or not phrase_groups:
+            phrase_groups.append(group_moras)
+
+        pre = (audio_query.get("prePhonemeLength") or 0.0) / speed
+        post = (audio_query.get("postPhonemeLength") or 0.0) / speed
+        lengths = np.asarray(lengths, dtype=np.float64) / speed
+        boundaries = pre + np.concatenate(([0.0], np.cumsum(lengths)))
+        duration = float(boundaries[-1] + post)
+
+        # ポーズを除いた発話モーラだけを残す
+        spoken = ~np.asarray(is_pause, dtype=bool)
+        starts = boundaries[:-1][spoken]
+        ends = boundaries[1:][spoken]
+        mora_texts = [t for t, pause in zip(mora_texts, is_pause) if not pause]
+
+        mora_char_starts = cls._map_chars(text, phrase_groups)
+        return cls(mora_texts, starts, ends, mora_char_starts, duration)
+
+    @staticmethod
+    def _map_chars(text: str, phrase_groups: List[int]) -> np.ndarray:
+        """
+        各モーラに元テキストの文字位置を割り当てる
+
+        句読点で区切った文字のまとまりと、pause_moraで区切ったモーラのまとまりの数が一致すれば
+        まとまりごとに、一致しなければ全体で、文字数に比例して対応付ける
+        """
+        total_moras = sum(phrase_groups)
+        if total_moras == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # 句読点（連続する句読点・改行はまとめる）で文字のまとまりに分割
+        text_groups = []
+        for match in re.finditer(rf"[^{PAUSE_PUNCTUATION}]+[{PAUSE_PUNCTUATION}\s]*", text):
+            if match.group().strip(PAUSE_PUNCTUATION + " \t\r\n"):
+                text_groups.append((match.start(), match.end()))
+
+        if len(text_groups) != len(phrase_groups):
+            text_groups = [(0, len(text))]
+            phrase_groups = [total_moras]
+
+        char_starts = []
+        for (char_begin, char_end), mora_count in zip(text_groups, phrase_groups):
+            if mora_count == 0:
+                continue
+            span = char_end - char_begin
+            char_starts.append(char_begin + np.floor(np.arange(mora_count) * span / mora_count))
+
+        return np.concatenate(char_starts).astype(np.int64)
+
+    def mora_at_char(self, char_offset: int) -> int:
+        """文字位置に対応するモーラ番号（二分探索）"""
+        index = int(np.searchsorted(self.mora_char_starts, char_offset, side="right")) - 1
+        return min(max(index, 0), len(self.starts) - 1)
+
+    def time_at_char(self, char_offset: int) -> float:
+        """文字位置の発話開始時刻（秒）"""
+        if len(self.starts) == 0:
+            return 0.0
+        return float(self.starts[self.mora_at_char(char_offset)])
+
+    def mora_at_time(self, t: float) -> int:
+        """時刻に発話中（または直前）のモーラ番号（二分探索）"""
+        index = int(np.searchsorted(self.starts, t, side="right")) - 1
+        return min(max(index, 0), len(self.starts) - 1)
+
+    def line_starts(self, lines: List[str], text: str) -> List[float]:
+        """
+        元テキスト内の各行の表示開始時刻を取得
+
+        Args:
+            lines: 表示する行（textの中に順番どおり含まれていること）
+            text: 音声クエリの元になったテキスト
+
+        Returns:
+            各行の開始時刻（秒）。最初の行は0秒から表示する
+        """
+        starts = []
+        search_from = 0
+        for i, line in enumerate(lines):
+            offset = text.find(line, search_from)
+            if offset < 0:
+                offset = search_from
+            search_from = offset + len(line)
+            starts.append(0.0 if i == 0 else self.time_at_char(offset))
+
+        # 単調増加を保証
+        return [float(t) for t in np.maximum.accumulate(starts)] if starts else []
@@ -1,41 +1,190 @@
+import json
+import mimetypes
+import os
+import random
 import requests
+import threading
 import time
-from typing import Optional
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from .audio_extractor import decode_pcm, extract_speech_audio, probe_duration
+from .audio_utils import find_silence_splits
+from .callback_receiver import CallbackReceiver
+from .disk_cache import DiskCache, file_sha256
+from .silence_trimmer import trim_silence
+
+
+class _MultipartFileStream:
+    """
+    multipart/form-dataの本文をファイルから少しずつ読み出すストリーム
+
+    requestsに渡すとContent-Lengthを付けて、read()で読んだ分だけ送信する
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        field_name: str,
+        filename: str,
+        mime_type: str,
+        chunk_size: int = 1024 * 1024,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+        self._file = open(file_path, "rb")
+        self._total = len(self._head) + os.path.getsize(file_path) + len(self._tail)
+        self._chunk_size = chunk_size
+        self._progress_callback = progress_callback
+        self._sent = 0
+        self._last_reported = 0
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._chunk_size
+        size = min(size, self._chunk_size)
+
+        data = b""
+        if self._sent < len(self._head):
+            data = self._head[self._sent:self._sent + size]
+        if len(data) < size:
+            data += self._file.read(size - len(data))
+        if len(data) < size:
+            tail_pos = self._sent + len(data) - (self._total - len(self._tail))
+            if tail_pos >= 0:
+                data += self._tail[tail_pos:tail_pos + size - len(data)]
+
+        self._sent += len(data)
+        # 終端での空の読み込みでは通知しない（最後の (total, total) を二重に送らないように）
+        if data and self._progress_callback and (
+            self._sent - self._last_reported >= self._chunk_size or self._sent == self._total
+        ):
+            self._last_reported = self._sent
+            self._progress_callback(self._sent, self._total)
+        return data
 
 
 class GladiaAPI:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.gladia.io/v2",
+        callback_receiver: Optional[CallbackReceiver] = None,
+        cache: Optional[DiskCache] = None
+    ):
+        """
+        Args:
+            api_key: Gladia APIキー
+            base_url: APIのベースURL（テスト用のローカルサーバーにも向けられる）
+            callback_receiver: 完了コールバックの受信サーバー（指定時はポーリングの代わりに通知を待つ。
+                               APIから到達できるURLがない場合は使わない）
+            cache: 文字起こし結果のディスクキャッシュ（Noneの場合はキャッシュしない）
+        """
         self.api_key = api_key
-        self.base_url = "https://api.gladia.io/v2"
+        self.base_url = base_url.rstrip("/")
+        if callback_receiver is not None and not callback_receiver.is_reachable_from(self.base_url):
+            print("コールバックの公開URLが設定されていないため、ポーリングで結果を待ちます")
+            callback_receiver = None
+        self.callback_receiver = callback_receiver
+        self.cache = cache
         self.headers = {
             "x-gladia-key": api_key,
             "Content-Type": "application/json"
         }
 
-    def upload_file(self, file_path: str) -> Optional[str]:
-        """動画ファイルをアップロードしてURLを取得"""
-        try:
-            import os
-            import mimetypes
-
-            filename = os.path.basename(file_path)
-            # ファイルタイプを自動判定
-            mime_type, _ = mimetypes.guess_type(file_path)
-            if mime_type is None:
-                mime_type = "application/octet-stream"
-
-            print(f"ファイルアップロード中: {filename} ({mime_type})")
-
-            with open(file_path, "rb") as f:
-                # ファイル名とMIMEタイプを明示的に指定
-                files = {"audio": (filename, f, mime_type)}
-                response = requests.post(
-                    f"{self.base_url}/upload",
-                    headers={"x-gladia-key": self.api_key},
-                    files=files
-                )
+    def upload_file(
+        self,
+        file_path: str,
+        extract_audio: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        chunk_size: int = 1024 * 1024,
+        max_retries: int = 3,
+        timeout: Tuple[float, float] = (10.0, 300.0)
+    ) -> Optional[str]:
+        """
+        動画ファイルをアップロードしてURLを取得
+
+        extract_audioがTrueの場合、アップロード前に音声トラックだけを
+        モノラル・16kHzの小さな形式に変換して送る（変換できなければ元のファイルを送る）
+
+        ファイルはchunk_sizeずつ読み出しながら送信するので、メモリ使用量はファイルサイズによらず一定
+
+        Args:
+            file_path: アップロードするファイルのパス
+            extract_audio: 音声だけを抽出してからアップロードするか
+            progress_callback: 送信済みバイト数と合計バイト数を受け取るコールバック
+            chunk_size: 1回に読み出すバイト数（進捗の通知間隔も兼ねる）
+            max_retries: 接続エラー・タイムアウト・5xxのときの最大リトライ回数（最初から送り直す）
+            timeout: (接続タイムアウト, 読み取りタイムアウト)（秒）
+        """
+        if extract_audio:
+            audio_path = extract_speech_audio(file_path)
+            if audio_path:
+                try:
+                    return self.upload_file(
+                        audio_path,
+                        extract_audio=False,
+                        progress_callback=progress_callback,
+                        chunk_size=chunk_size,
+                        max_retries=max_retries,
+                        timeout=timeout
+                    )
+                finally:
+                    os.unlink(audio_path)
+            print("音声抽出に失敗したため、元のファイルをアップロードします")
+
+        filename = os.path.basename(file_path)
+        # ファイルタイプを自動判定
+        mime_type, _ = mimetypes.guess_type(file_path)
+        if mime_type is None:
+            mime_type = "application/octet-stream"
+
+        print(f"ファイルアップロード中: {filename} ({mime_type})")
+
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                delay = 2 ** (attempt - 1)
+                print(f"アップロードを{delay}秒後に再試行します（{attempt}/{max_retries}）")
+                time.sleep(delay)
+
+            try:
+                with _MultipartFileStream(
+                    file_path, "audio", filename, mime_type, chunk_size, progress_callback
+                ) as body:
+                    response = requests.post(
+                        f"{self.base_url}/upload",
+                        headers={
+                            "x-gladia-key": self.api_key,
+                            "Content-Type": body.content_type
+                        },
+                        data=body,
+                        timeout=timeout
+                    )
 
                 print(f"アップロードレスポンス: {response.status_code}")
+                if response.status_code >= 500 or response.status_code == 429:
+                    print(f"詳細: {response.text}")
+                    continue
                 response.raise_for_status()
 
                 result = response.json()
@@ -43,15 +192,68 @@ class GladiaAPI:
                 print(f"アップロード成功: {audio_url}")
                 return audio_url
 
-        except Exception as e:
-            print(f"ファイルアップロードエラー: {e}")
-            if 'response' in locals():
-                print(f"ステータスコード: {response.status_code}")
-                print(f"詳細: {response.text}")
-            return None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                print(f"ファイルアップロードエラー: {e}")
+                continue
+            except Exception as e:
+                print(f"ファイルアップロードエラー: {e}")
+                if 'response' in locals():
+                    print(f"ステータスコード: {response.status_code}")
+                    print(f"詳細: {response.text}")
+                return None
+
+        print("ファイルアップロードに失敗しました（リトライ上限）")
+        return None
 
-    def transcribe(self, audio_url: str, language: str = "ja") -> Optional[str]:
+    def transcribe(self, audio_url: str, language: str = "ja", media_duration: Optional[float] = None) -> Optional[str]:
         """音声ファイルを文字起こし"""
+        result = self.transcribe_result(audio_url, language, media_duration)
+        if result is None:
+            return None
+        return full_transcript(result)
+
+    def transcribe_result(
+        self,
+        audio_url: str,
+        language: str = "ja",
+        media_duration: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        音声ファイルを文字起こしし、Gladiaの結果全体（発話ごとのタイムスタンプを含む）を取得
+
+        Args:
+            audio_url: upload_fileで取得したURL
+            language: 言語コード
+            media_duration: 音声の長さ（秒）。待機の上限時間の計算に使う（不明な場合はGladiaの応答から取得）
+
+        Returns:
+            status が done のレスポンス（失敗時はNone）
+        """
+        receiver = self.callback_receiver
+        result_id = self.submit_transcription(audio_url, language, receiver.url if receiver is not None else None)
+        if not result_id:
+            return None
+
+        # 結果を取得（コールバックモードでは通知が届くまでポーリング間隔を長く取る）
+        wake = receiver.register(result_id) if receiver is not None else None
+        try:
+            return self._wait_for_result(result_id, media_duration, wake=wake)
+        finally:
+            if receiver is not None:
+                receiver.pop(result_id)
+
+    def submit_transcription(self, audio_url: str, language: str = "ja", callback_url: Optional[str] = None) -> Optional[str]:
+        """
+        文字起こしジョブを登録
+
+        Args:
+            audio_url: upload_fileで取得したURL
+            language: 言語コード
+            callback_url: 完了時にGladiaがPOSTするURL（Noneの場合はコールバックなし）
+
+        Returns:
+            結果ID（失敗時はNone）
+        """
         try:
             # 文字起こしリクエストを送信
             payload = {
@@ -60,11 +262,15 @@ class GladiaAPI:
                     "languages": [language]
                 }
             }
+            if callback_url:
+                payload["callback"] = True
+                payload["callback_config"] = {"url": callback_url, "method": "POST"}
 
             response = requests.post(
                 f"{self.base_url}/pre-recorded",
                 headers=self.headers,
-                json=payload
+                json=payload,
+                timeout=(10, 60)
             )
             response.raise_for_status()
             result = response.json()
@@ -74,53 +280,390 @@ class GladiaAPI:
             if not result_id:
                 print(f"結果IDが取得できませんでした: {result}")
                 return None
-
-            # 結果を取得（ポーリング）
-            return self._poll_result(result_id)
+            return result_id
 
         except Exception as e:
             print(f"文字起こしエラー: {e}")
             print(f"詳細: {response.text if 'response' in locals() else '不明'}")
             return None
 
-    def _poll_result(self, result_id: str, max_attempts: int = 60) -> Optional[str]:
+    def get_result(self, result_id: str) -> Dict:
+        """文字起こしジョブの現在の状態を1回だけ取得（通信エラー時は例外を送出）"""
+        response = requests.get(
+            f"{self.base_url}/pre-recorded/{result_id}",
+            headers=self.headers,
+            timeout=(10, 60)
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _poll_result(self, result_id: str, media_duration: Optional[float] = None) -> Optional[str]:
         """文字起こし結果をポーリングして取得"""
-        for attempt in range(max_attempts):
-            try:
-                response = requests.get(
-                    f"{self.base_url}/pre-recorded/{result_id}",
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                result = response.json()
+        result = self._wait_for_result(result_id, media_duration)
+        if result is None:
+            return None
+        return full_transcript(result)
 
-                status = result.get("status")
-                print(f"ポーリング {attempt + 1}/{max_attempts}: ステータス = {status}")
-
-                if status == "done":
-                    # テキストを抽出
-                    transcription = result.get("result", {}).get("transcription", {})
-                    full_transcript = transcription.get("full_transcript", "")
-                    return full_transcript
-                elif status == "error":
-                    error_msg = result.get("error", "不明なエラー")
-                    print(f"文字起こしエラー: {error_msg}")
-                    return None
+    def _wait_for_result(
+        self,
+        result_id: str,
+        media_duration: Optional[float] = None,
+        wake: Optional[threading.Event] = None,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0,
+        callback_interval: float = 30.0,
+        base_timeout: float = 300.0,
+        timeout_per_media_second: float = 1.0
+    ) -> Optional[Dict]:
+        """
+        文字起こしの完了を待って結果を取得
 
-                # 処理中の場合は待機
-                time.sleep(3)
+        最初は短い間隔でポーリングし、以降は間隔を指数的に（ジッター付きで）伸ばす
+        待機の上限は base_timeout + 音声の長さ × timeout_per_media_second
 
+        wakeを渡した場合（コールバックモード）は、通知が届いた時点ですぐに結果を取得する。
+        通知が届かない場合に備えて同じ間隔でも確認するが、間隔の上限はcallback_intervalまで伸ばす
+        """
+        started = time.monotonic()
+        interval = initial_interval
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                result = self.get_result(result_id)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # 一時的な通信エラーは次の確認まで待って再試行
+                print(f"結果取得エラー（再試行します）: {e}")
+                result = {}
+            except requests.exceptions.HTTPError as e:
+                status_code = e.response.status_code if e.response is not None else None
+                if status_code is None or not (status_code == 429 or status_code >= 500):
+                    print(f"結果取得エラー: {e}")
+                    return None
+                # レート制限・サーバーエラーでもジョブは処理中なので、間隔を伸ばしながら再試行
+                print(f"結果取得エラー（再試行します）: {e}")
+                result = {}
             except Exception as e:
                 print(f"結果取得エラー: {e}")
-                print(f"詳細: {response.text if 'response' in locals() else '不明'}")
                 return None
 
-        print("タイムアウト: 文字起こしが完了しませんでした")
+            status = result.get("status")
+            elapsed = time.monotonic() - started
+            print(f"ポーリング {attempt}回目（{elapsed:.1f}秒経過）: ステータス = {status}")
+
+            if status == "done":
+                return result
+            elif status == "error":
+                error_msg = result.get("error_code") or result.get("error", "不明なエラー")
+                print(f"文字起こしエラー: {error_msg}")
+                return None
+
+            # 音声の長さが分かれば待機の上限を伸ばす
+            if media_duration is None:
+                media_duration = (result.get("file") or {}).get("audio_duration")
+            deadline = base_timeout + timeout_per_media_second * (media_duration or 0.0)
+            remaining = deadline - elapsed
+            if remaining <= 0:
+                break
+
+            # 処理中の場合は待機
+            delay = min(interval * random.uniform(0.8, 1.2), remaining)
+            if wake is not None:
+                if wake.wait(delay):
+                    print("完了通知を受信しました")
+                    wake.clear()
+                interval = min(interval * 1.5, callback_interval)
+            else:
+                time.sleep(delay)
+                interval = min(interval * 1.5, max_interval)
+
+        print(f"タイムアウト: 文字起こしが完了しませんでした（{time.monotonic() - started:.0f}秒）")
         return None
 
-    def transcribe_from_file(self, file_path: str, language: str = "ja") -> Optional[str]:
+    def transcribe_from_file(
+        self,
+        file_path: str,
+        language: str = "ja",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        split_seconds: Optional[float] = None,
+        max_workers: int = 4,
+        remove_silence: bool = False,
+        content_hash: Optional[str] = None
+    ) -> Optional[str]:
         """ファイルから直接文字起こし（便利メソッド）"""
-        audio_url = self.upload_file(file_path)
-        if audio_url:
-            return self.transcribe(audio_url, language)
-        return None
+        result = self.transcribe_file_result(
+            file_path, language, progress_callback, split_seconds, max_workers, remove_silence, content_hash
+        )
+        if result is None:
+            return None
+        return full_transcript(result)
+
+    def _transcript_cache_key(self, file_path: str, language: str, content_hash: Optional[str] = None) -> str:
+        return DiskCache.make_key("gladia", content_hash or file_sha256(file_path), language)
+
+    def transcribe_file_result(
+        self,
+        file_path: str,
+        language: str = "ja",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        split_seconds: Optional[float] = None,
+        max_workers: int = 4,
+        remove_silence: bool = False,
+        content_hash: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        ファイルを文字起こしし、Gladiaの結果全体を取得
+
+        キャッシュがある場合はファイル内容のSHA-256で検索し、
+        同じ動画ならアップロードも文字起こしも行わずに保存済みの結果を返す
+
+        remove_silenceがTrueの場合は長い無音を取り除いてから送り、
+        結果のタイムスタンプは元の動画の時刻に戻す（取り除いた区間は result["silence_trim"]）
+
+        Args:
+            file_path: 動画（または音声）ファイルのパス
+            language: 言語コード
+            progress_callback: アップロードの進捗を受け取るコールバック（分割時は全チャンクの合計。
+                               呼び出したスレッドで呼ばれる）
+            split_seconds: 指定時、これより十分長い音声は無音の箇所でおよそこの長さに分割して並列に文字起こしする
+            max_workers: 分割時に同時に処理するチャンク数
+            remove_silence: 長い無音を取り除いてから文字起こしするか
+            content_hash: ファイル内容のSHA-256（計算済みの場合。Noneの場合はファイルを読んで計算）
+
+        Returns:
+            status が done のレスポンス（失敗時はNone）
+        """
+        cached = self.get_cached_file_result(file_path, language, content_hash)
+        if cached is not None:
+            return cached
+
+        source_path = file_path
+        trimmed = trim_silence(file_path) if remove_silence else None
+        if trimmed is not None:
+            source_path, offset_map = trimmed
+
+        try:
+            spans = None
+            if split_seconds:
+                # 分割するほど長くないことがヘッダから分かれば、全体をデコードして無音を探さない
+                media_duration = probe_duration(source_path)
+                if media_duration is None or media_duration > split_seconds * 1.5:
+                    spans = self._plan_chunks(source_path, split_seconds)
+            if spans and len(spans) > 1:
+                result = self._transcribe_chunks(source_path, spans, language, max_workers, progress_callback)
+            else:
+                audio_url = self.upload_file(source_path, progress_callback=progress_callback)
+                if not audio_url:
+                    return None
+                result = self.transcribe_result(audio_url, language)
+        finally:
+            if trimmed is not None:
+                os.unlink(source_path)
+
+        if result is not None and trimmed is not None:
+            result = _map_result_timestamps(result, offset_map.to_original)
+            result["silence_trim"] = offset_map.to_dict()
+
+        if result is not None:
+            self.store_file_result(file_path, language, result, content_hash)
+        return result
+
+    def get_cached_file_result(self, file_path: str, language: str = "ja", content_hash: Optional[str] = None) -> Optional[Dict]:
+        """ファイル内容が同じ動画の保存済み文字起こし結果を取得（キャッシュなし・未保存の場合はNone）"""
+        if self.cache is None:
+            return None
+        try:
+            cached = self.cache.get(self._transcript_cache_key(file_path, language, content_hash))
+            if cached is None:
+                return None
+            print(f"文字起こしキャッシュを使用: {os.path.basename(file_path)}")
+            return json.loads(cached.decode("utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"文字起こしキャッシュ読み込みエラー: {e}")
+            return None
+
+    def store_file_result(self, file_path: str, language: str, result: Dict, content_hash: Optional[str] = None):
+        """文字起こし結果をファイル内容のハッシュで保存（キャッシュなしの場合は何もしない）"""
+        if self.cache is None:
+            return
+        try:
+            key = self._transcript_cache_key(file_path, language, content_hash)
+        except OSError as e:
+            print(f"文字起こしキャッシュ書き込みエラー: {e}")
+            return
+        self.cache.put(key, json.dumps(result, ensure_ascii=False).encode("utf-8"))
+
+    def _plan_chunks(self, file_path: str, split_seconds: float, sample_rate: int = 16000) -> Optional[List[Tuple[float, float]]]:
+        """
+        音声を無音の箇所で分割する範囲を決める
+
+        Returns:
+            (開始秒, 長さ秒) のリスト（デコードできない場合はNone）
+        """
+        pcm_path = decode_pcm(file_path, sample_rate=sample_rate)
+        if pcm_path is None:
+            return None
+
+        try:
+            if os.path.getsize(pcm_path) < 2:
+                return None
+            samples = np.memmap(pcm_path, dtype="<i2", mode="r")
+            duration = len(samples) / sample_rate
+            splits = find_silence_splits(samples, sample_rate, target_seconds=split_seconds)
+            del samples
+        finally:
+            os.unlink(pcm_path)
+
+        bounds = [0.0] + splits + [duration]
+        return [(start, end - start) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def _transcribe_chunk(
+        self,
+        file_path: str,
+        start: float,
+        duration: float,
+        language: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Optional[Dict]:
+        """音声の一部分を切り出してアップロードし、文字起こし"""
+        chunk_path = extract_speech_audio(file_path, start=start, duration=duration)
+        if chunk_path is None:
+            return None
+        try:
+            audio_url = self.upload_file(chunk_path, extract_audio=False, progress_callback=progress_callback)
+        finally:
+            os.unlink(chunk_path)
+        if not audio_url:
+            return None
+        return self.transcribe_result(audio_url, language, media_duration=duration)
+
+    def _transcribe_chunks(
+        self,
+        file_path: str,
+        spans: List[Tuple[float, float]],
+        language: str,
+        max_workers: int = 4,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Optional[Dict]:
+        """
+        分割した各チャンクを並列に文字起こしし、タイムスタンプをずらして1つの結果に結合
+
+        各チャンクのアップロード進捗はワーカースレッドで集計し、
+        progress_callbackにはこのメソッドを呼んだスレッドから全チャンクの合計を渡す
+
+        Returns:
+            Gladiaの結果と同じ形（result.transcription の full_transcript / utterances）の辞書
+            いずれかのチャンクが失敗した場合はNone
+        """
+        print(f"長い音声を{len(spans)}チャンクに分割して並列に文字起こしします")
+        results: List[Optional[Dict]] = [None] * len(spans)
+
+        # チャンクごとの (送信済みバイト数, 合計バイト数)。合計は音声を切り出すまで0
+        uploads = [(0, 0)] * len(spans)
+        uploads_lock = threading.Lock()
+        last_reported = None
+
+        def track(i: int) -> Callable[[int, int], None]:
+            def update(sent: int, total: int):
+                with uploads_lock:
+                    uploads[i] = (sent, total)
+            return update
+
+        def report():
+            nonlocal last_reported
+            with uploads_lock:
+                snapshot = list(uploads)
+            started = [(sent, total, spans[i][1]) for i, (sent, total) in enumerate(snapshot) if total]
+            if not started:
+                return
+            sent = sum(s for s, _, _ in started)
+            total = sum(t for _, t, _ in started)
+            # まだ切り出していないチャンクの大きさは、切り出し済みのチャンクの秒あたりのサイズから見積もる
+            started_seconds = sum(d for _, _, d in started)
+            waiting_seconds = sum(duration for (_, duration), (_, t) in zip(spans, snapshot) if not t)
+            if started_seconds > 0:
+                total += int(total / started_seconds * waiting_seconds)
+            if (sent, total) != last_reported:
+                last_reported = (sent, total)
+                progress_callback(sent, total)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._transcribe_chunk,
+                    file_path,
+                    start,
+                    duration,
+                    language,
+                    track(i) if progress_callback else None
+                ): i
+                for i, (start, duration) in enumerate(spans)
+            }
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(not_done, timeout=0.2, return_when=FIRST_COMPLETED)
+                if progress_callback:
+                    report()
+                for future in done:
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        print(f"チャンク{i + 1}の文字起こしエラー: {e}")
+                    print(f"チャンク{i + 1}/{len(spans)}の文字起こし{'完了' if results[i] else '失敗'}")
+
+        failed = [i + 1 for i, result in enumerate(results) if result is None]
+        if failed:
+            print(f"文字起こしに失敗したチャンクがあります: チャンク{failed}")
+            return None
+
+        texts = []
+        utterances = []
+        for (offset, _), result in zip(spans, results):
+            transcription = (result.get("result") or {}).get("transcription") or {}
+            texts.append(transcription.get("full_transcript", "").strip())
+            for utterance in transcription.get("utterances") or []:
+                utterances.append(_map_timestamps(utterance, lambda t, offset=offset: t + offset))
+
+        total_duration = spans[-1][0] + spans[-1][1]
+        return {
+            "status": "done",
+            "file": {"audio_duration": total_duration},
+            "result": {
+                "metadata": {"audio_duration": total_duration, "number_of_chunks": len(spans)},
+                "transcription": {
+                    "full_transcript": "\n".join(text for text in texts if text),
+                    "utterances": utterances
+                }
+            }
+        }
+
+
+def _map_timestamps(utterance: Dict, convert: Callable[[float], float]) -> Dict:
+    """発話（と含まれる単語）のstart/endをconvertで変換したコピーを返す"""
+    mapped = dict(utterance)
+    for field in ("start", "end"):
+        if isinstance(mapped.get(field), (int, float)):
+            mapped[field] = convert(mapped[field])
+    if mapped.get("words"):
+        mapped["words"] = [_map_timestamps(word, convert) for word in mapped["words"]]
+    return mapped
+
+
+def _map_result_timestamps(result: Dict, convert: Callable[[float], float]) -> Dict:
+    """Gladiaの結果に含まれる発話・単語のタイムスタンプを変換したコピーを返す"""
+    result = dict(result)
+    result["result"] = dict(result.get("result") or {})
+    transcription = dict(result["result"].get("transcription") or {})
+    transcription["utterances"] = [
+        _map_timestamps(utterance, convert) for utterance in transcription.get("utterances") or []
+    ]
+    result["result"]["transcription"] = transcription
+    return result
+
+
+def full_transcript(result: Dict) -> str:
+    """Gladiaの結果から全文を取り出す"""
+    transcription = (result.get("result") or {}).get("transcription") or {}
+    return transcription.get("full_transcript", "")
@@ -253,6 +253,32 @@ class VideoGenerator:
         # numpy配列に変換
         return np.array(image)
 
+    def _line_timings(self, text: str, lines, duration: float, timing_index=None):
+        """
+        各行の表示開始時刻と表示時間を計算
+
+        timing_indexがあれば各行の最初の文字が発話される時刻（二分探索）を、
+        なければ文字数比例で配分した時刻を使う
+
+        Returns:
+            (開始時刻のリスト, 表示時間のリスト)
+        """
+        if timing_index is not None and lines:
+            starts = [min(start, duration) for start in timing_index.line_starts(lines, text)]
+        else:
+            char_counts = [len(line) for line in lines]
+            total_chars = sum(char_counts)
+            starts = []
+            current_time = 0.0
+            for char_count in char_counts:
+                starts.append(current_time)
+                current_time += (char_count / total_chars) * duration if total_chars > 0 else duration / len(lines)
+
+        # 各行は次の行が始まるまで（最後の行は音声の終わりまで）表示する
+        ends = starts[1:] + [duration]
+        durations = [max(0.1, end - start) for start, end in zip(starts, ends)]
+        return starts, durations
+
     def create_video(
         self,
         text: str,
@@ -262,7 +288,8 @@ class VideoGenerator:
         font_size=90,
         max_chars_per_subtitle=20,  # 1つの字幕あたりの最大文字数
         timing_info=None,  # VOICEVOXからのタイミング情報
-        timing_offset=0.0  # タイミングオフセット（秒）：マイナスで早く、プラスで遅く
+        timing_offset=0.0,  # タイミングオフセット（秒）：マイナスで早く、プラスで遅く
+        timing_index=None  # VOICEVOXの音声クエリから作成したTimingIndex
     ) -> bytes:
         """
         音声に合わせて縦書き字幕を表示する動画を生成
@@ -296,37 +323,20 @@ class VideoGenerator:
             )
 
             # タイミング情報の処理
-            if timing_info and len(timing_info) > 0:
+            if timing_index is not None or (timing_info and len(timing_info) > 0):
                 # VOICEVOXの正確なタイミング情報を使用
-                print(f"VOICEVOXタイミング情報を使用: {len(timing_info)}フレーズ")
-
-                # デバッグ: 実際の音声の長さとタイミング情報の合計を比較
-                timing_total = sum([t["duration"] for t in timing_info])
-                print(f"[DEBUG] 実際の音声の長さ: {duration:.2f}秒")
-                print(f"[DEBUG] タイミング情報の合計: {timing_total:.2f}秒")
-                print(f"[DEBUG] 差分: {duration - timing_total:.2f}秒")
-
-                # タイミング情報を実際の音声の長さに合わせてスケーリング（必須）
-                scale_factor = duration / timing_total if timing_total > 0 else 1.0
-                print(f"[DEBUG] タイミングをスケーリング: {scale_factor:.4f}倍")
-
-                # すべてのタイミング情報をスケーリング
-                scaled_timing_info = []
-                for t in timing_info:
-                    scaled_timing_info.append({
-                        "text": t["text"],
-                        "start": t["start"] * scale_factor,
-                        "duration": t["duration"] * scale_factor
-                    })
+                if timing_info:
+                    print(f"VOICEVOXタイミング情報を使用: {len(timing_info)}フレーズ")
 
-                # 再計算後の合計を確認
-                timing_total_scaled = sum([t["duration"] for t in scaled_timing_info])
-                print(f"[DEBUG] スケーリング後の合計: {timing_total_scaled:.2f}秒")
+                    # タイミング情報は先頭の無音・子音・話速を含めて計算済みなので、スケーリングは不要
+                    timing_end = timing_info[-1]["start"] + timing_info[-1]["duration"]
+                    print(f"[DEBUG] 実際の音声の長さ: {duration:.2f}秒 / 最後のフレーズの終了: {timing_end:.2f}秒")
 
-                # 新設計：シンプル＆予測可能
-                # ユーザーの改行位置を尊重 + 文字数比例タイミング配分 + オフセット調整
-
-                print(f"[新設計] ユーザー主導の改行 + 文字数比例タイミング")
+                # ユーザーの改行位置を尊重 + 発話時刻（または文字数比例）のタイミング + オフセット調整
+                if timing_index is not None:
+                    print(f"[INFO] ユーザー主導の改行 + モーラ単位の発話時刻")
+                else:
+                    print(f"[新設計] ユーザー主導の改行 + 文字数比例タイミング")
 
                 # ユーザーが入力したテキストを改行で分割
                 lines = text.split('\n')
@@ -348,28 +358,19 @@ class VideoGenerator:
                 print(f"[INFO] 音声の長さ: {duration:.2f}秒")
                 print(f"[INFO] 1文字あたり: {duration / total_chars:.3f}秒" if total_chars > 0 else "[INFO] 文字数0")
 
-                # 文字数比例でタイミングを配分（シンプル＆確実）
+                # 各行の開始時刻を計算（TimingIndexがあれば発話時刻、なければ文字数比例）
                 segments = user_segments
-                segment_starts = []
-                segment_durations = []
-
-                current_time = 0.0
-                for i, char_count in enumerate(segment_char_counts):
-                    # この行の長さ = 全体の長さ × (この行の文字数 / 総文字数)
-                    seg_duration = (char_count / total_chars) * duration if total_chars > 0 else duration / len(user_segments)
-
-                    segment_starts.append(current_time)
-                    segment_durations.append(seg_duration)
+                segment_starts, segment_durations = self._line_timings(text, user_segments, duration, timing_index)
 
+                for i in range(len(user_segments)):
                     # デバッグ情報（最初の5個と最後の5個）
                     if i < 5 or i >= len(user_segments) - 5:
                         seg_preview = user_segments[i][:20] + "..." if len(user_segments[i]) > 20 else user_segments[i]
-                        print(f"[行{i+1:02d}] '{seg_preview}' | {current_time:.2f}s-{current_time + seg_duration:.2f}s ({char_count}文字)")
+                        print(f"[行{i+1:02d}] '{seg_preview}' | {segment_starts[i]:.2f}s-{segment_starts[i] + segment_durations[i]:.2f}s ({segment_char_counts[i]}文字)")
                     elif i == 5:
                         print(f"[...] ({len(user_segments) - 10}行を省略)")
 
-                    current_time += seg_duration
-
+                current_time = segment_starts[-1] + segment_durations[-1] if segment_starts else 0.0
                 print(f"[INFO] 最終行終了時刻: {current_time:.2f}秒（音声: {duration:.2f}秒）")
                 print(f"[SUCCESS] 全{len(segments)}行が{duration:.2f}秒に配分されました")
 
@@ -622,7 +623,14 @@ class VideoGenerator:
             print(traceback.format_exc())
             raise  # エラーを再スローしてStreamlitに表示
 
-    def create_segment_video(self, text: str, audio_data: bytes, segment_index: int = 0) -> bytes:
+    def create_segment_video(
+        self,
+        text: str,
+        audio_data: bytes = None,
+        segment_index: int = 0,
+        audio_path: str = None,
+        timing_index=None
+    ) -> bytes:
         """
         単一クリップの動画を生成（改行ごとに字幕を切り替え）
 
@@ -630,6 +638,8 @@ class VideoGenerator:
             text: クリップのテキスト（改行区切り）
             audio_data: クリップの音声データ（WAV形式）
             segment_index: クリップ番号（表示用）
+            audio_path: クリップの音声ファイルのパス（指定時はaudio_dataの代わりに使用し、削除しない）
+            timing_index: 音声合成に使ったクエリのTimingIndex（指定時は各行の発話開始時刻で字幕を切り替える）
 
         Returns:
             動画データ（MP4バイト列）
@@ -638,10 +648,12 @@ class VideoGenerator:
             print(f"\n[クリップ{segment_index + 1}] 動画生成開始")
             print(f"[クリップ{segment_index + 1}] テキスト: {text[:30]}..." if len(text) > 30 else f"[クリップ{segment_index + 1}] テキスト: {text}")
 
-            # 音声ファイルを一時保存
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as audio_file:
-                audio_path = audio_file.name
-                audio_file.write(audio_data)
+            # 音声ファイルを一時保存（パスが渡された場合はそのまま使う）
+            owns_audio_file = audio_path is None
+            if owns_audio_file:
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as audio_file:
+                    audio_path = audio_file.name
+                    audio_file.write(audio_data)
 
             # 音声クリップを作成
             audio_clip = AudioFileClip(audio_path)
@@ -664,17 +676,14 @@ class VideoGenerator:
             print(f"[クリップ{segment_index + 1}] 受信したテキスト（改行あり）: {repr(text)}")
             print(f"[クリップ{segment_index + 1}] 分割後の各行: {user_segments}")
 
-            # 各行の文字数を計算
-            segment_char_counts = [len(seg) for seg in user_segments]
-            total_chars = sum(segment_char_counts)
+            # 各行の表示開始時刻と長さを計算
+            segment_starts, segment_durations = self._line_timings(text, user_segments, duration, timing_index)
 
-            # 文字数比例でタイミングを配分
             text_clips = []
-            current_time = 0.0
 
             for i, seg_text in enumerate(user_segments):
-                char_count = segment_char_counts[i]
-                seg_duration = (char_count / total_chars) * duration if total_chars > 0 else duration / len(user_segments)
+                current_time = segment_starts[i]
+                seg_duration = segment_durations[i]
 
                 # 縦書きテキスト画像を生成
                 text_img = self.create_vertical_text_image(
@@ -696,7 +705,6 @@ class VideoGenerator:
                 text_clips.append(img_clip)
 
                 print(f"[クリップ{segment_index + 1}] 行{i+1}: {seg_text[:20]}... | {current_time:.2f}s-{current_time + seg_duration:.2f}s")
-                current_time += seg_duration
 
             # 背景と字幕を合成
             if text_clips:
@@ -727,7 +735,8 @@ class VideoGenerator:
             # クリーンアップ
             audio_clip.close()
             final_clip.close()
-            os.unlink(audio_path)
+            if owns_audio_file:
+                os.unlink(audio_path)
             os.unlink(video_path)
 
             return video_data
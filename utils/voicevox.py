@@ -1,22 +1,350 @@
 import requests
+import asyncio
+import copy
 import json
-from typing import List, Dict, Optional
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unicodedata
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .disk_cache import DiskCache
+from .audio_utils import concat_wav_files, concat_wavs, wav_duration, wav_file_duration
+from .text_segmenter import TextSegmenter
+from .timing_index import TimingIndex
+
+# キャラクター試聴用のサンプル文
+SAMPLE_TEXT = "こんにちは、VOICEVOXです。よろしくお願いします。"
+
+
+class EngineUnavailableError(Exception):
+    """エンジンが停止中（サーキットブレーカーが開いている）ため、リクエストを送らずに失敗した"""
+
+
+class CircuitBreaker:
+    """
+    連続失敗回数でエンジンへのリクエストを遮断するサーキットブレーカー
+
+    failure_threshold回連続で失敗すると開き、cooldown秒の間は即座に失敗させる。
+    cooldown経過後は1件だけ試行を通し、成功すれば閉じ、失敗すれば再び開く。
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    @property
+    def is_open(self) -> bool:
+        """遮断中（cooldown中）かどうか"""
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.cooldown
+
+    def allow(self) -> bool:
+        """リクエストを送ってよいかどうか"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.cooldown or self._trial_in_progress:
+                return False
+            # cooldown経過後の試行は1件だけ通す
+            self._trial_in_progress = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_progress = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    print(f"[VOICEVOX] {self._failures}回連続で失敗したため、{self.cooldown:.0f}秒間リクエストを停止します")
+                self._opened_at = time.monotonic()
+
+
+def _normalize_text(text: str) -> str:
+    """キャッシュキー用にテキストを正規化（前後の空白とUnicode表記揺れのみ吸収）"""
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def _voice_cache_key(text: str, speaker_id: int, params: Dict, version: Optional[str]) -> Optional[str]:
+    """合成音声のキャッシュキーを生成（バージョン不明の場合はキャッシュしない）"""
+    if version is None:
+        return None
+    return DiskCache.make_key("voice", _normalize_text(text), speaker_id, params, version)
+
+
+def _timing_from_query(audio_query: Dict, speed: Optional[float] = None) -> List[Dict]:
+    """
+    音声クエリのaccent_phrasesから各フレーズのタイミング情報を計算
+
+    エンジンの合成と同じく子音・母音・ポーズの長さと先頭の無音（prePhonemeLength）を
+    話速で割って計算するので、実際の音声に合わせたスケーリングは不要
+    """
+    index = TimingIndex.from_query(audio_query, "", speed)
+    speed = speed or audio_query.get("speedScale", 1.0) or 1.0
+    timing_info = []
+    mora_pos = 0
+
+    for phrase in audio_query.get("accent_phrases", []):
+        moras = phrase.get("moras", [])
+        if not moras:
+            continue
+
+        # フレーズの開始はその最初のモーラ、終わりはポーズを含めた次のフレーズの直前
+        start = float(index.starts[mora_pos])
+        end = float(index.ends[mora_pos + len(moras) - 1])
+        pause_mora = phrase.get("pause_mora")
+        if pause_mora:
+            pause_length = audio_query.get("pauseLength")
+            if pause_length is None:
+                pause_length = (pause_mora.get("vowel_length") or 0.0) * audio_query.get("pauseLengthScale", 1.0)
+            end += pause_length / speed
+
+        timing_info.append({
+            "text": "".join(mora.get("text", "") for mora in moras),
+            "start": start,
+            "duration": end - start
+        })
+        mora_pos += len(moras)
+
+    return timing_info
+
+
+def _offset_timing(audio_query: Optional[Dict], offset: float, speed: float) -> List[Dict]:
+    """クリップのタイミング情報を結合後の位置へずらす"""
+    if not audio_query:
+        return []
+
+    return [
+        {"text": t["text"], "start": offset + t["start"], "duration": t["duration"]}
+        for t in _timing_from_query(audio_query, speed)
+    ]
 
 
 class VoiceVoxAPI:
-    def __init__(self, base_url: str = "http://localhost:50021"):
-        self.base_url = base_url
+    def __init__(
+        self,
+        base_url: str = "http://localhost:50021",
+        pool_size: int = 8,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 60.0,
+        max_retries: int = 2,
+        cache: Optional[DiskCache] = None,
+        query_cache_size: int = 256,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        sample_cache: Optional[DiskCache] = None
+    ):
+        """
+        Args:
+            base_url: VOICEVOXエンジンのURL
+            pool_size: 接続プールの最大接続数（並列合成するスレッド数以上を推奨）
+            connect_timeout: 接続タイムアウト（秒）
+            read_timeout: 読み取りタイムアウト（秒）
+            max_retries: 接続失敗・5xx時の再試行回数（読み取りタイムアウトは再試行しない）
+            cache: 合成済み音声（WAV）のディスクキャッシュ（Noneの場合はキャッシュしない）
+            query_cache_size: メモリに保持する音声クエリの最大件数（0で無効）
+            failure_threshold: この回数連続で失敗したらリクエストを遮断する
+            cooldown: 遮断してから再試行するまでの秒数
+            sample_cache: 試聴用サンプル音声のディスクキャッシュ（(スピーカーID, エンジンバージョン)単位）
+        """
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.sample_cache = sample_cache
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.breaker = CircuitBreaker(failure_threshold, cooldown)
+
+        # 接続プール（keep-alive）はアダプタが保持し、全スレッドで共有する
+        # audio_query / synthesis は同じ入力なら同じ結果を返すため、POSTも再試行対象にする
+        # 読み取りタイムアウトは再試行しない（固まったエンジンに read_timeout × 回数待たされないよう、
+        # 1回で失敗させてサーキットブレーカーに数える）
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        )
+        self._adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        # Sessionのクッキー等の状態はスレッドセーフではないため、スレッドごとに作成する
+        self._local = threading.local()
+
+        # エンジンのバージョン（キャッシュキーに含める）
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._version_ttl = 60.0
+
+        # 音声クエリのキャッシュ（(テキスト, スピーカーID) → audio_query）
+        # 話速は合成時にコピーへ適用するため、同じクエリを合成・タイミング取得・話速変更で共有できる
+        self._query_cache: "OrderedDict[Tuple[str, int], Dict]" = OrderedDict()
+        self._query_cache_size = query_cache_size
+        self._query_lock = threading.Lock()
+
+        # スピーカーの事前初期化（モデル読み込み）をバックグラウンドで行う
+        self._warmup_executor: Optional[ThreadPoolExecutor] = None
+        self._warmups: Dict[int, Future] = {}
+        self._warmup_lock = threading.Lock()
+        self._sample_job: Optional[Future] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """現在のスレッド用のSession（接続プールは全スレッドで共有）"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
+
+    @property
+    def engine_count(self) -> int:
+        """リクエストを分散できるエンジンの数（並列数の目安）"""
+        return 1
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """エンジンへリクエストを送信（タイムアウト・再試行・サーキットブレーカー付き）"""
+        if not self.breaker.allow():
+            raise EngineUnavailableError(f"VOICEVOXエンジンが応答しないため停止中です: {self.base_url}")
+
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            # 4xxは入力の問題なのでエンジン障害として数えない
+            if e.response is not None and e.response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        except requests.RequestException:
+            # 接続エラー・タイムアウトに加え、途中で切れたレスポンス（ChunkedEncodingError等）も障害として数える
+            # （半開状態の試行が失敗したまま遮断が解けなくならないよう、必ず結果を記録する）
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return response
+
+    def is_alive(self, timeout: float = 2.0) -> bool:
+        """
+        エンジンが応答するかを短いタイムアウトで確認（一括処理の前に使う）
+
+        再試行はせず、結果はサーキットブレーカーにも反映する
+        """
+        if self.breaker.is_open:
+            return False
+        try:
+            response = requests.get(f"{self.base_url}/version", timeout=(min(1.0, timeout), timeout))
+            response.raise_for_status()
+        except Exception as e:
+            print(f"[VOICEVOX] エンジンに接続できません: {self.base_url} ({e})")
+            self.breaker.record_failure()
+            return False
+        self.breaker.record_success()
+        return True
+
+    def get_version(self) -> Optional[str]:
+        """エンジンのバージョンを取得（一定時間メモ化）"""
+        if self._version and time.monotonic() - self._version_checked_at < self._version_ttl:
+            return self._version
+        try:
+            response = self._request("GET", "/version")
+            self._version = str(response.json())
+            self._version_checked_at = time.monotonic()
+        except Exception as e:
+            print(f"バージョン取得エラー: {e}")
+        return self._version
 
     def get_speakers(self) -> List[Dict]:
         """VOICEVOXのスピーカー一覧を取得"""
         try:
-            response = requests.get(f"{self.base_url}/speakers")
-            response.raise_for_status()
+            response = self._request("GET", "/speakers")
             return response.json()
         except Exception as e:
             print(f"スピーカー取得エラー: {e}")
             return []
 
+    def is_initialized_speaker(self, speaker_id: int) -> bool:
+        """スピーカーのモデルが読み込み済みかを確認"""
+        try:
+            response = self._request("GET", "/is_initialized_speaker", params={"speaker": speaker_id})
+            return bool(response.json())
+        except Exception as e:
+            print(f"スピーカー初期化状態の取得エラー: {e}")
+            return False
+
+    def _initialize_speaker(self, speaker_id: int):
+        """スピーカーのモデルを読み込む（読み込み済みなら何もしない、失敗時は例外を送出）"""
+        response = self._request("GET", "/is_initialized_speaker", params={"speaker": speaker_id})
+        if response.json():
+            return
+        print(f"[VOICEVOX] スピーカー{speaker_id}を初期化中...")
+        self._request("POST", "/initialize_speaker", params={"speaker": speaker_id, "skip_reinit": "true"})
+
+    def initialize_speaker(self, speaker_id: int) -> bool:
+        """
+        スピーカーのモデルを事前に読み込む（初回合成の待ち時間をなくす）
+
+        Returns:
+            初期化済みになったかどうか
+        """
+        try:
+            self._initialize_speaker(speaker_id)
+            return True
+        except Exception as e:
+            print(f"スピーカー初期化エラー: {e}")
+            return False
+
+    def warm_up_speaker(self, speaker_id: int) -> Future:
+        """
+        スピーカーの初期化をバックグラウンドで開始（画面をブロックしない）
+
+        同じスピーカーの初期化が実行中・成功済みの場合は、そのFutureを返す
+        """
+        with self._warmup_lock:
+            future = self._warmups.get(speaker_id)
+            if future is not None and (not future.done() or future.result()):
+                return future
+            if self._warmup_executor is None:
+                self._warmup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="voicevox-warmup")
+            future = self._warmup_executor.submit(self.initialize_speaker, speaker_id)
+            self._warmups[speaker_id] = future
+            return future
+
+    def ensure_speaker_ready(self, speaker_id: int) -> bool:
+        """
+        一括処理の前にスピーカーを初期化済みにする
+
+        バックグラウンドの初期化が実行中なら完了を待ち、そうでなければここで初期化する
+        """
+        with self._warmup_lock:
+            future = self._warmups.get(speaker_id)
+        if future is not None and not future.done():
+            return future.result()
+        return self.initialize_speaker(speaker_id)
+
     def get_speaker_styles(self, speakers: List[Dict]) -> Dict[str, List[Dict]]:
         """スピーカーとスタイルの辞書を作成"""
         speaker_styles = {}
@@ -35,15 +363,111 @@ class VoiceVoxAPI:
                         return style.get("id")
         return None
 
+    def _fetch_audio_query(self, text: str, speaker_id: int) -> Dict:
+        """音声クエリを取得（キャッシュ優先、失敗時は例外を送出）"""
+        key = (text, speaker_id)
+        with self._query_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        response = self._request(
+            "POST",
+            "/audio_query",
+            params={"text": text, "speaker": speaker_id}
+        )
+        audio_query = response.json()
+
+        if self._query_cache_size > 0:
+            with self._query_lock:
+                self._query_cache[key] = audio_query
+                self._query_cache.move_to_end(key)
+                while len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return copy.deepcopy(audio_query)
+
+    def _synthesize(self, audio_query: Dict, speaker_id: int, speed: float) -> bytes:
+        """音声クエリから音声を合成（失敗時は例外を送出）"""
+        # 話速を設定（呼び出し元のクエリは変更しない）
+        audio_query = dict(audio_query, speedScale=speed)
+
+        response = self._request(
+            "POST",
+            "/synthesis",
+            params={"speaker": speaker_id},
+            headers={"Content-Type": "application/json"},
+            data=json.dumps(audio_query)
+        )
+        return response.content
+
+    def _generate_voice(self, text: str, speaker_id: int, speed: float) -> bytes:
+        """テキストから音声を生成（キャッシュ優先、失敗時は例外を送出）"""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = _voice_cache_key(text, speaker_id, {"speedScale": speed}, self.get_version())
+            if cache_key:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        audio_query = self._fetch_audio_query(text, speaker_id)
+        audio_data = self._synthesize(audio_query, speaker_id, speed)
+        if cache_key:
+            self.cache.put(cache_key, audio_data)
+        return audio_data
+
+    def _synthesize_to_file(self, audio_query: Dict, speaker_id: int, speed: float, output_path: str) -> str:
+        """音声クエリから合成した音声をファイルへ分割して書き込む（失敗時は例外を送出）"""
+        audio_query = dict(audio_query, speedScale=speed)
+
+        response = self._request(
+            "POST",
+            "/synthesis",
+            params={"speaker": speaker_id},
+            headers={"Content-Type": "application/json"},
+            data=json.dumps(audio_query),
+            stream=True
+        )
+        # 書き込み途中のファイルが見えないよう、一時ファイルに書いてからリネーム
+        tmp_path = f"{output_path}.part"
+        try:
+            with response, open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return output_path
+
+    def _generate_voice_to_file(self, text: str, speaker_id: int, speed: float, output_path: str) -> str:
+        """テキストから合成した音声をファイルへ書き込む（キャッシュ優先、失敗時は例外を送出）"""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = _voice_cache_key(text, speaker_id, {"speedScale": speed}, self.get_version())
+            cached_path = self.cache.get_path(cache_key) if cache_key else None
+            if cached_path:
+                shutil.copyfile(cached_path, output_path)
+                return output_path
+
+        audio_query = self._fetch_audio_query(text, speaker_id)
+        self._synthesize_to_file(audio_query, speaker_id, speed, output_path)
+        if cache_key:
+            self.cache.put_file(cache_key, output_path)
+        return output_path
+
+    def is_voice_cached(self, text: str, speaker_id: int, speed: float = 1.2) -> bool:
+        """generate_voiceの結果がディスクキャッシュにあるかを確認（エンジンには合成を依頼しない）"""
+        if self.cache is None:
+            return False
+        cache_key = _voice_cache_key(text, speaker_id, {"speedScale": speed}, self.get_version())
+        return bool(cache_key) and self.cache.contains(cache_key)
+
     def generate_audio_query(self, text: str, speaker_id: int) -> Optional[Dict]:
-        """テキストから音声クエリを生成"""
+        """テキストから音声クエリを生成（同じテキスト・スピーカーはキャッシュを再利用）"""
         try:
-            response = requests.post(
-                f"{self.base_url}/audio_query",
-                params={"text": text, "speaker": speaker_id}
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._fetch_audio_query(text, speaker_id)
         except Exception as e:
             print(f"音声クエリ生成エラー: {e}")
             return None
@@ -51,73 +475,448 @@ class VoiceVoxAPI:
     def synthesize_voice(self, audio_query: Dict, speaker_id: int, speed: float = 1.2) -> Optional[bytes]:
         """音声クエリから音声を合成"""
         try:
-            # 話速を設定
-            audio_query["speedScale"] = speed
-
-            response = requests.post(
-                f"{self.base_url}/synthesis",
-                params={"speaker": speaker_id},
-                headers={"Content-Type": "application/json"},
-                data=json.dumps(audio_query)
-            )
-            response.raise_for_status()
-            return response.content
+            return self._synthesize(audio_query, speaker_id, speed)
         except Exception as e:
             print(f"音声合成エラー: {e}")
             return None
 
     def generate_voice(self, text: str, speaker_id: int, speed: float = 1.2) -> Optional[bytes]:
-        """テキストから直接音声を生成（便利メソッド）"""
-        audio_query = self.generate_audio_query(text, speaker_id)
-        if audio_query:
-            return self.synthesize_voice(audio_query, speaker_id, speed)
-        return None
+        """テキストから直接音声を生成（便利メソッド、キャッシュがあれば再合成しない）"""
+        try:
+            return self._generate_voice(text, speaker_id, speed)
+        except Exception as e:
+            print(f"音声合成エラー: {e}")
+            return None
+
+    def synthesize_to_file(self, audio_query: Dict, speaker_id: int, output_path: str, speed: float = 1.2) -> Optional[str]:
+        """音声クエリから合成した音声をファイルに保存（音声全体をメモリに載せない）"""
+        try:
+            return self._synthesize_to_file(audio_query, speaker_id, speed, output_path)
+        except Exception as e:
+            print(f"音声合成エラー: {e}")
+            return None
+
+    def generate_voice_to_file(self, text: str, speaker_id: int, output_path: str, speed: float = 1.2) -> Optional[str]:
+        """テキストから合成した音声をファイルに保存（便利メソッド、キャッシュがあればコピーのみ）"""
+        try:
+            return self._generate_voice_to_file(text, speaker_id, speed, output_path)
+        except Exception as e:
+            print(f"音声合成エラー: {e}")
+            return None
+
+    def generate_many(
+        self,
+        texts: List[str],
+        speaker_id: int,
+        speed: float = 1.2,
+        max_workers: int = 4,
+        output_dir: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        複数テキストの音声をスレッドプールで並列生成
+
+        Args:
+            texts: テキストのリスト（クリップごと）
+            speaker_id: スピーカーID
+            speed: 話速
+            max_workers: 同時に合成する最大数（接続プールのサイズ以下を推奨）
+            output_dir: 指定した場合は音声をメモリに返さず、このディレクトリにclip_001.wav...として保存
+
+        Returns:
+            入力と同じ順序の結果リスト
+            各要素: {"index": 番号, "text": テキスト, "audio": WAVバイト列 or None,
+                     "path": 保存先パス or None, "error": エラー内容 or None}
+        """
+        results = [
+            {"index": i, "text": text, "audio": None, "path": None, "error": None}
+            for i, text in enumerate(texts)
+        ]
+        if not texts:
+            return results
+
+        # エンジンが落ちている場合は全クリップを即座に失敗させる
+        if not self.is_alive():
+            for result in results:
+                result["error"] = "VOICEVOXエンジンに接続できません"
+            return results
+
+        # モデル読み込みを1クリップ目の合成に含めないよう、先に初期化しておく
+        self.ensure_speaker_ready(speaker_id)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(texts)))) as executor:
+            if output_dir:
+                futures = {
+                    executor.submit(
+                        self._generate_voice_to_file,
+                        text,
+                        speaker_id,
+                        speed,
+                        os.path.join(output_dir, f"clip_{i+1:03d}.wav")
+                    ): i
+                    for i, text in enumerate(texts)
+                }
+            else:
+                futures = {
+                    executor.submit(self._generate_voice, text, speaker_id, speed): i
+                    for i, text in enumerate(texts)
+                }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    if output_dir:
+                        results[i]["path"] = future.result()
+                    else:
+                        results[i]["audio"] = future.result()
+                except Exception as e:
+                    results[i]["error"] = str(e)
+                    print(f"[クリップ{i+1}] 音声合成エラー: {e}")
+
+        return results
+
+    def _multi_synthesize(self, audio_queries: List[Dict], speaker_id: int, speed: float) -> List[bytes]:
+        """
+        /multi_synthesis で複数の音声クエリを1リクエストで合成（失敗時は例外を送出）
+
+        レスポンスのZIPは一時ファイルへ分割して書き込み、WAVを順番どおりに取り出す
+        """
+        audio_queries = [dict(q, speedScale=speed) for q in audio_queries]
+        response = self._request(
+            "POST",
+            "/multi_synthesis",
+            params={"speaker": speaker_id},
+            headers={"Content-Type": "application/json"},
+            data=json.dumps(audio_queries),
+            stream=True
+        )
+        with response, tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as buffer:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer.write(chunk)
+            buffer.seek(0)
+
+            with zipfile.ZipFile(buffer) as archive:
+                # エントリ名は 001.wav, 002.wav ... の連番（入力順）
+                names = sorted(name for name in archive.namelist() if name.endswith(".wav"))
+                if len(names) != len(audio_queries):
+                    raise ValueError(f"ZIP内のWAV数が一致しません: {len(names)} / {len(audio_queries)}")
+                return [archive.read(name) for name in names]
+
+    def _synthesize_batch(self, texts: List[str], speaker_id: int, speed: float) -> List[Tuple[Optional[bytes], Optional[str]]]:
+        """
+        1バッチ分の音声クエリを取得し、/multi_synthesis で1リクエストにまとめて合成
+
+        クエリの取得に失敗したテキスト（4xx等）はそのテキストだけをエラーにする。
+        接続エラー・タイムアウトはバッチ全体の失敗として例外を送出する
+
+        Returns:
+            入力と同じ順序の (WAV or None, エラー内容 or None) のリスト
+        """
+        outcomes: List[Tuple[Optional[bytes], Optional[str]]] = [(None, None)] * len(texts)
+        queries: Dict[int, Dict] = {}
+        for j, text in enumerate(texts):
+            try:
+                queries[j] = self._fetch_audio_query(text, speaker_id)
+            except (requests.HTTPError, ValueError) as e:
+                outcomes[j] = (None, str(e))
+
+        ready = sorted(queries)
+        if ready:
+            wavs = self._multi_synthesize([queries[j] for j in ready], speaker_id, speed)
+            for j, audio_data in zip(ready, wavs):
+                outcomes[j] = (audio_data, None)
+        return outcomes
+
+    def generate_many_batched(
+        self,
+        texts: List[str],
+        speaker_id: int,
+        speed: float = 1.2,
+        batch_size: int = 16,
+        max_workers: int = 4
+    ) -> List[Dict]:
+        """
+        複数テキストの音声を /multi_synthesis でまとめて生成（短いクリップが多い場合向け）
+
+        最大batch_size件ずつのバッチに分け、バッチごとに音声クエリの取得と合成（1リクエスト）を
+        スレッドプールで並列に行う
+
+        Args:
+            texts: テキストのリスト（クリップごと）
+            speaker_id: スピーカーID
+            speed: 話速
+            batch_size: 1回の /multi_synthesis に含める最大件数
+            max_workers: 同時に実行する最大リクエスト数
+
+        Returns:
+            入力と同じ順序の結果リスト（generate_manyと同じ形式）
+        """
+        results = [
+            {"index": i, "text": text, "audio": None, "path": None, "error": None}
+            for i, text in enumerate(texts)
+        ]
+
+        # キャッシュ済みのクリップは合成しない
+        cache_keys: Dict[int, Optional[str]] = {}
+        pending = []
+        for i, text in enumerate(texts):
+            cache_key = None
+            if self.cache is not None:
+                cache_key = _voice_cache_key(text, speaker_id, {"speedScale": speed}, self.get_version())
+                cached = self.cache.get(cache_key) if cache_key else None
+                if cached is not None:
+                    results[i]["audio"] = cached
+                    continue
+            cache_keys[i] = cache_key
+            pending.append(i)
+
+        if not pending:
+            return results
+
+        if not self.is_alive():
+            for i in pending:
+                results[i]["error"] = "VOICEVOXエンジンに接続できません"
+            return results
+
+        self.ensure_speaker_ready(speaker_id)
+
+        # バッチ単位でクエリ取得と合成を行う（ワーカーが遊ばないよう、バッチ数はmax_workers以上にする）
+        size = max(1, min(batch_size, -(-len(pending) // max(1, max_workers))))
+        batches = [pending[j:j + size] for j in range(0, len(pending), size)]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            futures = {
+                executor.submit(self._synthesize_batch, [texts[i] for i in batch], speaker_id, speed): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    print(f"一括音声合成エラー: {e}")
+                    for i in batch:
+                        results[i]["error"] = str(e)
+                    continue
+
+                for i, (audio_data, error) in zip(batch, outcomes):
+                    if audio_data is None:
+                        results[i]["error"] = error
+                        print(f"[クリップ{i+1}] 音声クエリ生成エラー: {error}")
+                        continue
+                    results[i]["audio"] = audio_data
+                    if cache_keys[i]:
+                        self.cache.put(cache_keys[i], audio_data)
+
+        return results
+
+    def generate_voice_from_clips(
+        self,
+        clips: List[str],
+        speaker_id: int,
+        output_dir: str,
+        speed: float = 1.2,
+        gap_seconds: float = 0.0,
+        max_workers: int = 4
+    ) -> Optional[Dict]:
+        """
+        クリップごとに1回だけ合成し、全体の音声はクリップ音声を結合して作成
+
+        全体音声とクリップ動画用の音声で同じ合成結果を使うため、エンジンの処理は1回分で済む。
+        クリップ音声はメモリに載せずoutput_dirへ保存し、結合もファイルから行う。
+        返したパスのファイルは呼び出し側で使い終わったら削除する
+
+        Args:
+            clips: クリップのテキストのリスト
+            speaker_id: スピーカーID
+            output_dir: クリップ音声（clip_001.wav...）と結合音声（combined.wav）の保存先
+            speed: 話速
+            gap_seconds: クリップ間に挿入する無音の長さ（秒）
+            max_workers: 同時に合成する最大数
+
+        Returns:
+            {"audio": 全体のWAV, "audio_path": 全体のWAVのパス, "clip_paths": クリップごとのWAVのパスのリスト,
+             "timing_info": 全体のタイミング情報}
+            いずれかのクリップの合成に失敗した場合はNone
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        results = self.generate_many(clips, speaker_id, speed, max_workers=max_workers, output_dir=output_dir)
+        failed = [r["index"] + 1 for r in results if r["path"] is None]
+        if failed:
+            print(f"クリップ単位の音声合成に失敗しました: クリップ{failed}")
+            return None
+
+        clip_paths = [r["path"] for r in results]
+        try:
+            audio_path = concat_wav_files(clip_paths, os.path.join(output_dir, "combined.wav"), gap_seconds)
+            with open(audio_path, "rb") as f:
+                audio_data = f.read()
+        except Exception as e:
+            print(f"音声結合エラー: {e}")
+            return None
+
+        # クリップごとのタイミング情報を結合後の位置へずらす（オフセットは実際の音声の長さで進める）
+        timing_info = []
+        offset = 0.0
+        for clip_text, clip_path in zip(clips, clip_paths):
+            clip_duration = wav_file_duration(clip_path)
+            audio_query = self.generate_audio_query(clip_text, speaker_id)
+            timing_info.extend(_offset_timing(audio_query, offset, speed))
+            offset += clip_duration + gap_seconds
+
+        return {
+            "audio": audio_data,
+            "audio_path": audio_path,
+            "clip_paths": clip_paths,
+            "timing_info": timing_info
+        }
+
+    def generate_voice_long(
+        self,
+        text: str,
+        speaker_id: int,
+        speed: float = 1.2,
+        max_chunk_chars: int = 100,
+        max_workers: int = 4
+    ) -> Optional[Dict]:
+        """
+        長文を文単位に分割して並列合成し、1つの音声とタイミング情報に結合
+
+        長いテキストを1回の /audio_query に渡すと処理時間が大きく伸びるため、
+        文末の句読点（。！？）で分割した短いチャンクを並列に合成する
+
+        Args:
+            text: 合成するテキスト
+            speaker_id: スピーカーID
+            speed: 話速
+            max_chunk_chars: 1チャンクの最大文字数の目安（短い文はこの長さまでまとめる）
+            max_workers: 同時に合成する最大数
+
+        Returns:
+            {"audio": 結合後のWAV, "timing_info": 全体のタイミング情報}（失敗時はNone）
+        """
+        # 文に分割し、短い文はmax_chunk_charsまでまとめてリクエスト数を減らす
+        chunks: List[str] = []
+        for sentence in TextSegmenter().split_sentences(text):
+            if chunks and len(chunks[-1]) + len(sentence) <= max_chunk_chars:
+                chunks[-1] += sentence
+            else:
+                chunks.append(sentence)
+
+        if not chunks:
+            return None
+
+        print(f"[VOICEVOX] 長文モード: {len(text)}文字を{len(chunks)}チャンクに分割して合成")
+        results = self.generate_many(chunks, speaker_id, speed, max_workers=max_workers)
+        failed = [r["index"] + 1 for r in results if r["audio"] is None]
+        if failed:
+            print(f"長文の音声合成に失敗しました: チャンク{failed}")
+            return None
+
+        chunk_audios = [r["audio"] for r in results]
+        try:
+            # 各チャンクの前後の無音はエンジンが付けたまま結合する
+            audio_data = concat_wavs(chunk_audios)
+        except Exception as e:
+            print(f"音声結合エラー: {e}")
+            return None
+
+        timing_info = []
+        offset = 0.0
+        for chunk_text, chunk_audio in zip(chunks, chunk_audios):
+            chunk_duration = wav_duration(chunk_audio)
+            audio_query = self.generate_audio_query(chunk_text, speaker_id)
+            timing_info.extend(_offset_timing(audio_query, offset, speed))
+            offset += chunk_duration
+
+        return {
+            "audio": audio_data,
+            "timing_info": timing_info
+        }
+
+    def _sample_cache_key(self, speaker_id: int) -> Optional[str]:
+        version = self.get_version()
+        if version is None:
+            return None
+        return DiskCache.make_key("sample", SAMPLE_TEXT, speaker_id, version)
+
+    def _generate_sample_voice(self, speaker_id: int) -> bytes:
+        """サンプル音声を生成（キャッシュ優先、失敗時は例外を送出）"""
+        if self.sample_cache is None:
+            return self._generate_voice(SAMPLE_TEXT, speaker_id, 1.0)
+
+        cache_key = self._sample_cache_key(speaker_id)
+        if cache_key:
+            cached = self.sample_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        audio_query = self._fetch_audio_query(SAMPLE_TEXT, speaker_id)
+        audio_data = self._synthesize(audio_query, speaker_id, 1.0)
+        if cache_key:
+            self.sample_cache.put(cache_key, audio_data)
+        return audio_data
 
     def generate_sample_voice(self, speaker_id: int) -> Optional[bytes]:
-        """キャラクター試聴用のサンプル音声を生成"""
-        sample_text = "こんにちは、VOICEVOXです。よろしくお願いします。"
-        return self.generate_voice(sample_text, speaker_id, speed=1.0)
+        """キャラクター試聴用のサンプル音声を生成（生成済みならキャッシュから返す）"""
+        try:
+            return self._generate_sample_voice(speaker_id)
+        except Exception as e:
+            print(f"音声合成エラー: {e}")
+            return None
+
+    def pregenerate_samples(self, speaker_ids: Optional[List[int]] = None, max_workers: int = 2) -> Future:
+        """
+        全スタイルのサンプル音声をバックグラウンドで事前生成してキャッシュに保存
+
+        Args:
+            speaker_ids: 対象のスピーカーID（Noneの場合は /speakers の全スタイル）
+            max_workers: 同時に合成する最大数（スタイルごとにモデルを読み込むため少なめを推奨）
+
+        Returns:
+            ジョブのFuture（結果は生成できたサンプル数）。実行中・完了済みのジョブがあればそれを返す
+        """
+        with self._warmup_lock:
+            job = self._sample_job
+            if job is not None and (not job.done() or job.exception() is None):
+                return job
+            if self._warmup_executor is None:
+                self._warmup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="voicevox-warmup")
+            self._sample_job = self._warmup_executor.submit(self._pregenerate_samples, speaker_ids, max_workers)
+            return self._sample_job
+
+    def _pregenerate_samples(self, speaker_ids: Optional[List[int]], max_workers: int) -> int:
+        if speaker_ids is None:
+            speaker_ids = [
+                style.get("id")
+                for speaker in self.get_speakers()
+                for style in speaker.get("styles", [])
+                if style.get("id") is not None
+            ]
+
+        print(f"[VOICEVOX] サンプル音声の事前生成を開始: {len(speaker_ids)}スタイル")
+        generated = 0
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(self._generate_sample_voice, speaker_id): speaker_id for speaker_id in speaker_ids}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    generated += 1
+                except Exception as e:
+                    print(f"[VOICEVOX] スピーカー{futures[future]}のサンプル生成エラー: {e}")
+
+        print(f"[VOICEVOX] サンプル音声の事前生成が完了: {generated}/{len(speaker_ids)}スタイル")
+        return generated
 
     def get_timing_info(self, text: str, speaker_id: int, speed: float = 1.2) -> Optional[List[Dict]]:
         """テキストの各セグメント（句読点区切り）のタイミング情報を取得"""
         try:
-            # 音声クエリを生成
+            # 音声クエリを取得（合成時と同じクエリをキャッシュから再利用）
             audio_query = self.generate_audio_query(text, speaker_id)
             if not audio_query:
                 return None
 
-            # 話速を設定
-            audio_query["speedScale"] = speed
-
             # accent_phrases から各フレーズの長さを計算
-            accent_phrases = audio_query.get("accent_phrases", [])
-            timing_info = []
-            current_time = 0.0
-
-            for phrase in accent_phrases:
-                # フレーズの総時間を計算（各モーラの長さを合計）
-                # vowel_lengthはそのままの値を使用（VOICEVOXが返す値を信頼）
-                phrase_duration = 0.0
-                for mora in phrase.get("moras", []):
-                    phrase_duration += mora.get("vowel_length", 0.0)
-
-                # ポーズの長さを追加
-                pause_mora = phrase.get("pause_mora")
-                if pause_mora:
-                    phrase_duration += pause_mora.get("vowel_length", 0.0)
-
-                # フレーズのテキストを取得
-                phrase_text = ""
-                for mora in phrase.get("moras", []):
-                    phrase_text += mora.get("text", "")
-
-                timing_info.append({
-                    "text": phrase_text,
-                    "start": current_time,
-                    "duration": phrase_duration
-                })
-
-                current_time += phrase_duration
+            timing_info = _timing_from_query(audio_query, speed)
+            current_time = timing_info[-1]["start"] + timing_info[-1]["duration"] if timing_info else 0.0
 
             # デバッグ情報を出力
             print(f"[VOICEVOX] Speed: {speed}, Total timing duration: {current_time:.2f}秒")
@@ -127,3 +926,354 @@ class VoiceVoxAPI:
         except Exception as e:
             print(f"タイミング情報取得エラー: {e}")
             return None
+
+    def get_timing_index(self, text: str, speaker_id: int, speed: float = 1.2) -> Optional[TimingIndex]:
+        """
+        テキストのモーラ単位のタイミングインデックスを取得
+
+        合成時と同じ音声クエリ（キャッシュ済み）から作るので、追加のエンジン呼び出しは通常発生しない
+        """
+        try:
+            audio_query = self.generate_audio_query(text, speaker_id)
+            if not audio_query:
+                return None
+            return TimingIndex.from_query(audio_query, text, speed)
+        except Exception as e:
+            print(f"タイミングインデックス作成エラー: {e}")
+            return None
+
+
+class SpeakerCatalog:
+    """
+    スピーカー一覧のキャッシュ（セッション間で共有する想定）
+
+    TTL内はエンジンへ問い合わせず、期限切れ後はバックグラウンドで更新する。
+    更新時はエンジンのバージョンを確認し、変わっていなければ一覧を取り直さない。
+    """
+
+    def __init__(self, api: VoiceVoxAPI, ttl: float = 300.0):
+        """
+        Args:
+            api: VOICEVOXクライアント
+            ttl: キャッシュの有効期間（秒）
+        """
+        self.api = api
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._fetched_at = 0.0
+        self._version: Optional[str] = None
+        self._speakers: List[Dict] = []
+        self._styles_by_name: Dict[str, List[Dict]] = {}
+        self._id_by_name_style: Dict[Tuple[str, str], int] = {}
+
+    def _build_index(self, speakers: List[Dict], version: Optional[str]):
+        styles_by_name = self.api.get_speaker_styles(speakers)
+        id_by_name_style = {}
+        for name, styles in styles_by_name.items():
+            for style in styles:
+                id_by_name_style[(name, style.get("name", ""))] = style.get("id")
+
+        with self._lock:
+            self._speakers = speakers
+            self._styles_by_name = styles_by_name
+            self._id_by_name_style = id_by_name_style
+            self._version = version
+            self._fetched_at = time.monotonic()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        スピーカー一覧を更新（バージョンが変わっていない場合は取り直さない）
+
+        Returns:
+            一覧を保持しているかどうか
+        """
+        try:
+            version = self.api.get_version()
+            if not force and self._speakers and version is not None and version == self._version:
+                with self._lock:
+                    self._fetched_at = time.monotonic()
+                return True
+
+            speakers = self.api.get_speakers()
+            if speakers:
+                self._build_index(speakers, version)
+            return bool(self._speakers)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def invalidate(self):
+        """キャッシュを破棄（次回アクセス時に取り直す）"""
+        with self._lock:
+            self._speakers = []
+            self._styles_by_name = {}
+            self._id_by_name_style = {}
+            self._version = None
+            self._fetched_at = 0.0
+
+    def _ensure_fresh(self):
+        with self._lock:
+            has_data = bool(self._speakers)
+            expired = time.monotonic() - self._fetched_at >= self.ttl
+            if not expired or self._refreshing:
+                return
+            self._refreshing = True
+
+        if has_data:
+            # 古い一覧を返しつつ、裏で更新する（画面の再実行をブロックしない）
+            threading.Thread(target=self.refresh, daemon=True).start()
+        else:
+            self.refresh()
+
+    @property
+    def speakers(self) -> List[Dict]:
+        """スピーカー一覧（/speakersのレスポンスそのまま）"""
+        self._ensure_fresh()
+        return self._speakers
+
+    def speaker_names(self) -> List[str]:
+        """スピーカー名のリスト（エンジンが返した順）"""
+        return [speaker.get("name", "") for speaker in self.speakers]
+
+    def styles(self, speaker_name: str) -> List[Dict]:
+        """スピーカー名からスタイル一覧を取得"""
+        self._ensure_fresh()
+        return self._styles_by_name.get(speaker_name, [])
+
+    def find_speaker_id(self, speaker_name: str, style_name: str = "ノーマル") -> Optional[int]:
+        """スピーカー名とスタイル名からスピーカーIDを取得"""
+        self._ensure_fresh()
+        return self._id_by_name_style.get((speaker_name, style_name))
+
+
+class AsyncVoiceVoxAPI:
+    """
+    asyncio版のVOICEVOXクライアント（VoiceVoxAPIと同じメソッド構成）
+
+    aiohttpが必要（pip install aiohttp）。1つのイベントループ上で多数の合成リクエストを
+    スレッドなしで同時に処理する。複数エンジンを使う場合はエンジンごとにインスタンスを作成する。
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:50021",
+        max_concurrency: int = 16,
+        pool_size: int = 32,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 60.0,
+        max_retries: int = 2,
+        cache: Optional[DiskCache] = None,
+        query_cache_size: int = 256
+    ):
+        """
+        Args:
+            base_url: VOICEVOXエンジンのURL
+            max_concurrency: エンジンへ同時に送るリクエストの最大数
+            pool_size: 接続プールの最大接続数
+            connect_timeout: 接続タイムアウト（秒）
+            read_timeout: 読み取りタイムアウト（秒）
+            max_retries: 5xx・接続エラー時の再試行回数（読み取りタイムアウトは再試行しない）
+            cache: 合成済み音声（WAV）のディスクキャッシュ（Noneの場合はキャッシュしない）
+            query_cache_size: メモリに保持する音声クエリの最大件数（0で無効）
+        """
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError("AsyncVoiceVoxAPIにはaiohttpが必要です: pip install aiohttp") from e
+
+        self._aiohttp = aiohttp
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self.max_retries = max_retries
+        self.cache = cache
+
+        # セッションとセマフォは実行中のイベントループ上で遅延生成する
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._version_ttl = 60.0
+
+        self._query_cache: "OrderedDict[Tuple[str, int], Dict]" = OrderedDict()
+        self._query_cache_size = query_cache_size
+
+    async def __aenter__(self) -> "AsyncVoiceVoxAPI":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """接続プールを閉じる"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _ensure_session(self):
+        if self._session is None or self._session.closed:
+            connector = self._aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            self._session = self._aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _request(self, method: str, path: str, **kwargs) -> bytes:
+        """エンジンへリクエストを送信し、レスポンス本文を返す（同時実行数制限・再試行付き）"""
+        session = self._ensure_session()
+        url = f"{self.base_url}{path}"
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    async with session.request(method, url, **kwargs) as response:
+                        response.raise_for_status()
+                        return await response.read()
+            except (self._aiohttp.ClientConnectionError, self._aiohttp.ClientResponseError, asyncio.TimeoutError) as e:
+                status = getattr(e, "status", None)
+                retryable = not isinstance(e, asyncio.TimeoutError) and (status is None or status >= 500)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(0.3 * (2 ** attempt))
+
+    async def get_version(self) -> Optional[str]:
+        """エンジンのバージョンを取得（一定時間メモ化）"""
+        if self._version and time.monotonic() - self._version_checked_at < self._version_ttl:
+            return self._version
+        try:
+            body = await self._request("GET", "/version")
+            self._version = str(json.loads(body))
+            self._version_checked_at = time.monotonic()
+        except Exception as e:
+            print(f"バージョン取得エラー: {e}")
+        return self._version
+
+    async def get_speakers(self) -> List[Dict]:
+        """VOICEVOXのスピーカー一覧を取得"""
+        try:
+            return json.loads(await self._request("GET", "/speakers"))
+        except Exception as e:
+            print(f"スピーカー取得エラー: {e}")
+            return []
+
+    async def _fetch_audio_query(self, text: str, speaker_id: int) -> Dict:
+        """音声クエリを取得（キャッシュ優先、失敗時は例外を送出）"""
+        key = (text, speaker_id)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+        body = await self._request(
+            "POST",
+            "/audio_query",
+            params={"text": text, "speaker": speaker_id}
+        )
+        audio_query = json.loads(body)
+
+        if self._query_cache_size > 0:
+            self._query_cache[key] = audio_query
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return copy.deepcopy(audio_query)
+
+    async def _synthesize(self, audio_query: Dict, speaker_id: int, speed: float) -> bytes:
+        """音声クエリから音声を合成（失敗時は例外を送出）"""
+        audio_query = dict(audio_query, speedScale=speed)
+        return await self._request(
+            "POST",
+            "/synthesis",
+            params={"speaker": speaker_id},
+            headers={"Content-Type": "application/json"},
+            data=json.dumps(audio_query)
+        )
+
+    async def _generate_voice(self, text: str, speaker_id: int, speed: float) -> bytes:
+        """テキストから音声を生成（キャッシュ優先、失敗時は例外を送出）"""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = _voice_cache_key(text, speaker_id, {"speedScale": speed}, await self.get_version())
+            if cache_key:
+                # ディスクI/Oでイベントループを止めないようスレッドで実行
+                cached = await asyncio.to_thread(self.cache.get, cache_key)
+                if cached is not None:
+                    return cached
+
+        audio_query = await self._fetch_audio_query(text, speaker_id)
+        audio_data = await self._synthesize(audio_query, speaker_id, speed)
+        if cache_key:
+            await asyncio.to_thread(self.cache.put, cache_key, audio_data)
+        return audio_data
+
+    async def generate_audio_query(self, text: str, speaker_id: int) -> Optional[Dict]:
+        """テキストから音声クエリを生成（同じテキスト・スピーカーはキャッシュを再利用）"""
+        try:
+            return await self._fetch_audio_query(text, speaker_id)
+        except Exception as e:
+            print(f"音声クエリ生成エラー: {e}")
+            return None
+
+    async def synthesize_voice(self, audio_query: Dict, speaker_id: int, speed: float = 1.2) -> Optional[bytes]:
+        """音声クエリから音声を合成"""
+        try:
+            return await self._synthesize(audio_query, speaker_id, speed)
+        except Exception as e:
+            print(f"音声合成エラー: {e}")
+            return None
+
+    async def generate_voice(self, text: str, speaker_id: int, speed: float = 1.2) -> Optional[bytes]:
+        """テキストから直接音声を生成（便利メソッド、キャッシュがあれば再合成しない）"""
+        try:
+            return await self._generate_voice(text, speaker_id, speed)
+        except Exception as e:
+            print(f"音声合成エラー: {e}")
+            return None
+
+    async def generate_many(self, texts: List[str], speaker_id: int, speed: float = 1.2) -> List[Dict]:
+        """
+        複数テキストの音声を並列生成（同時実行数はmax_concurrencyで制限）
+
+        Returns:
+            入力と同じ順序の結果リスト（VoiceVoxAPI.generate_manyと同じ形式）
+        """
+        outcomes = await asyncio.gather(
+            *(self._generate_voice(text, speaker_id, speed) for text in texts),
+            return_exceptions=True
+        )
+        results = []
+        for i, (text, outcome) in enumerate(zip(texts, outcomes)):
+            if isinstance(outcome, BaseException):
+                print(f"[クリップ{i+1}] 音声合成エラー: {outcome}")
+                results.append({"index": i, "text": text, "audio": None, "path": None, "error": str(outcome)})
+            else:
+                results.append({"index": i, "text": text, "audio": outcome, "path": None, "error": None})
+        return results
+
+    async def generate_sample_voice(self, speaker_id: int) -> Optional[bytes]:
+        """キャラクター試聴用のサンプル音声を生成"""
+        return await self.generate_voice(SAMPLE_TEXT, speaker_id, speed=1.0)
+
+    async def get_timing_info(self, text: str, speaker_id: int, speed: float = 1.2) -> Optional[List[Dict]]:
+        """テキストの各セグメント（句読点区切り）のタイミング情報を取得"""
+        try:
+            audio_query = await self.generate_audio_query(text, speaker_id)
+            if not audio_query:
+                return None
+            return _timing_from_query(audio_query, speed)
+        except Exception as e:
+            print(f"タイミング情報取得エラー: {e}")
+            return None
+
+    async def get_timing_index(self, text: str, speaker_id: int, speed: float = 1.2) -> Optional[TimingIndex]:
+        """テキストのモーラ単位のタイミングインデックスを取得"""
+        try:
+            audio_query = await self.generate_audio_query(text, speaker_id)
+            if not audio_query:
+                return None
+            return TimingIndex.from_query(audio_query, text, speed)
+        except Exception as e:
+            print(f"タイミングインデックス作成エラー: {e}")
+            return None
@@ -0,0 +1,216 @@
+"""
+VOICEVOXエンジンプール
+複数のエンジンへ負荷分散し、定期的なヘルスチェックで障害エンジンを切り離す
+"""
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import requests
+
+from .disk_cache import DiskCache
+from .voicevox import VoiceVoxAPI, EngineUnavailableError
+
+
+class VoiceVoxEnginePool(VoiceVoxAPI):
+    """
+    複数のVOICEVOXエンジンを1つのVoiceVoxAPIとして扱うクライアント
+
+    各リクエストは処理中件数が最も少ない正常なエンジンへ送る。音声クエリと合成の組は
+    同じエンジンに固定し、そのエンジンが落ちたら別の正常なエンジンで組ごとやり直す。
+    キャッシュ（ディスク・音声クエリ）はプール全体で共有する。
+    """
+
+    def __init__(
+        self,
+        base_urls: List[str],
+        health_check_interval: float = 10.0,
+        max_failures: int = 2,
+        cache: Optional[DiskCache] = None,
+        query_cache_size: int = 256,
+        sample_cache: Optional[DiskCache] = None,
+        **client_kwargs
+    ):
+        """
+        Args:
+            base_urls: VOICEVOXエンジンのURLリスト
+            health_check_interval: ヘルスチェック（/version）の間隔（秒）
+            max_failures: 連続で失敗したら切り離す回数
+            cache: 合成済み音声（WAV）のディスクキャッシュ
+            query_cache_size: メモリに保持する音声クエリの最大件数
+            sample_cache: 試聴用サンプル音声のディスクキャッシュ
+            client_kwargs: 各エンジンのVoiceVoxAPIに渡す設定（pool_size, タイムアウトなど）
+        """
+        if not base_urls:
+            raise ValueError("エンジンのURLを1つ以上指定してください")
+
+        super().__init__(
+            base_urls[0],
+            cache=cache,
+            query_cache_size=query_cache_size,
+            sample_cache=sample_cache,
+            **client_kwargs
+        )
+        self.engines = [VoiceVoxAPI(url, query_cache_size=0, **client_kwargs) for url in base_urls]
+        self.health_check_interval = health_check_interval
+        self.max_failures = max_failures
+
+        self._state_lock = threading.Lock()
+        self._in_flight = [0] * len(self.engines)
+        self._failures = [0] * len(self.engines)
+        self._healthy = [True] * len(self.engines)
+        self._pinned = threading.local()
+
+        # 最初のリクエストを落ちているエンジンに振り分けないよう、先に一度確認しておく
+        self.check_health()
+
+        self._stop_event = threading.Event()
+        self._health_thread = threading.Thread(target=self._health_loop, daemon=True)
+        self._health_thread.start()
+
+    @property
+    def engine_count(self) -> int:
+        """正常なエンジンの数"""
+        with self._state_lock:
+            return max(1, sum(self._healthy))
+
+    def close(self):
+        """ヘルスチェックを停止"""
+        self._stop_event.set()
+
+    def _acquire_engine(self, exclude: Optional[Set[int]] = None) -> Optional[int]:
+        """
+        処理中件数が最も少ない正常なエンジンを選ぶ
+
+        excludeを指定しない場合、正常なエンジンがなければ全エンジンから選ぶ。
+        指定した場合（やり直し時）は、exclude以外に正常なエンジンがなければNoneを返す
+        """
+        with self._state_lock:
+            candidates = [
+                i for i, healthy in enumerate(self._healthy)
+                if healthy and not self.engines[i].breaker.is_open and i not in (exclude or ())
+            ]
+            if not candidates:
+                if exclude:
+                    return None
+                candidates = list(range(len(self.engines)))
+            index = min(candidates, key=lambda i: self._in_flight[i])
+            self._in_flight[index] += 1
+            return index
+
+    def _release_engine(self, index: int):
+        with self._state_lock:
+            self._in_flight[index] -= 1
+
+    def _with_failover(self, func: Callable, *args, **kwargs):
+        """
+        このスレッドを1つのエンジンに固定してfuncを実行
+
+        固定したエンジンが接続エラー・タイムアウト・停止中で失敗した場合は、そのエンジンを外して
+        別の正常なエンジンに固定し直し、funcを最初からやり直す（音声クエリと合成の組を同じエンジンで行うため）。
+        すでに固定済み（入れ子の呼び出し）の場合はそのまま実行する
+        """
+        if getattr(self._pinned, "index", None) is not None:
+            return func(*args, **kwargs)
+
+        tried: Set[int] = set()
+        index = self._acquire_engine()
+        while True:
+            self._pinned.index = index
+            try:
+                return func(*args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout, EngineUnavailableError) as e:
+                tried.add(index)
+                failed_url = self.engines[index].base_url
+                self._pinned.index = None
+                self._release_engine(index)
+                index = self._acquire_engine(exclude=tried)
+                if index is None:
+                    raise
+                print(f"[VOICEVOX] {failed_url} で失敗したため {self.engines[index].base_url} でやり直します: {e}")
+            finally:
+                if self._pinned.index is not None:
+                    self._pinned.index = None
+                    self._release_engine(index)
+
+    def _record_result(self, index: int, ok: bool):
+        with self._state_lock:
+            if ok:
+                if not self._healthy[index]:
+                    print(f"[VOICEVOX] エンジン復帰: {self.engines[index].base_url}")
+                self._failures[index] = 0
+                self._healthy[index] = True
+            else:
+                self._failures[index] += 1
+                if self._healthy[index] and self._failures[index] >= self.max_failures:
+                    print(f"[VOICEVOX] エンジンを切り離します: {self.engines[index].base_url}")
+                    self._healthy[index] = False
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """固定中のエンジン（なければ最も空いているエンジン）へリクエストを送信"""
+        return self._with_failover(self._pinned_request, method, path, **kwargs)
+
+    def _pinned_request(self, method: str, path: str, **kwargs) -> requests.Response:
+        index = self._pinned.index
+        try:
+            response = self.engines[index]._request(method, path, **kwargs)
+        except (requests.ConnectionError, requests.Timeout, EngineUnavailableError):
+            self._record_result(index, False)
+            raise
+        self._record_result(index, True)
+        return response
+
+    def _generate_voice(self, text: str, speaker_id: int, speed: float) -> bytes:
+        # 音声クエリと合成を同じエンジンで行う
+        return self._with_failover(super()._generate_voice, text, speaker_id, speed)
+
+    def _generate_sample_voice(self, speaker_id: int) -> bytes:
+        return self._with_failover(super()._generate_sample_voice, speaker_id)
+
+    def _generate_voice_to_file(self, text: str, speaker_id: int, speed: float, output_path: str) -> str:
+        return self._with_failover(super()._generate_voice_to_file, text, speaker_id, speed, output_path)
+
+    def _synthesize_batch(self, texts: List[str], speaker_id: int, speed: float) -> List[Tuple[Optional[bytes], Optional[str]]]:
+        # バッチの音声クエリと /multi_synthesis を同じエンジンで行う
+        return self._with_failover(super()._synthesize_batch, texts, speaker_id, speed)
+
+    def is_alive(self, timeout: float = 2.0) -> bool:
+        """いずれかのエンジンが応答するかを確認"""
+        return any(engine.is_alive(timeout) for engine in self.engines)
+
+    def _initialize_speaker(self, speaker_id: int):
+        """正常な全エンジンでスピーカーを初期化（どのエンジンに振り分けられても待たないように）"""
+        targets = [engine for i, engine in enumerate(self.engines) if self._healthy[i]]
+        errors = []
+        for engine in targets or self.engines:
+            try:
+                engine._initialize_speaker(speaker_id)
+            except Exception as e:
+                errors.append(f"{engine.base_url}: {e}")
+        if errors and len(errors) == len(targets or self.engines):
+            raise RuntimeError(" / ".join(errors))
+        for error in errors:
+            print(f"スピーカー初期化エラー: {error}")
+
+    def _health_loop(self):
+        while not self._stop_event.wait(self.health_check_interval):
+            self.check_health()
+
+    def check_health(self) -> List[Dict]:
+        """
+        全エンジンの /version を確認し、失敗したエンジンを切り離す・復帰したエンジンを戻す
+
+        Returns:
+            各エンジンの状態 [{"url": URL, "healthy": bool, "in_flight": 処理中件数}]
+        """
+        for index, engine in enumerate(self.engines):
+            try:
+                engine._request("GET", "/version", timeout=(1.0, 2.0))
+                self._record_result(index, True)
+            except Exception:
+                self._record_result(index, False)
+
+        with self._state_lock:
+            return [
+                {"url": engine.base_url, "healthy": self._healthy[i], "in_flight": self._in_flight[i]}
+                for i, engine in enumerate(self.engines)
+            ]